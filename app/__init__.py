@@ -3,19 +3,47 @@ HomeFeed - Flask Application Factory.
 """
 
 import os
-import json
+import time
+import importlib
 from flask import Flask, session, redirect, url_for, request, jsonify
 from flask_compress import Compress
 from flask_session import Session
 
 
+# Request paths that never need auth or profile checks (matched with a single
+# str.startswith call before any service lookups happen)
+_SKIP_PREFIXES = ('/static/', '/favicon.ico')
+
+# Endpoint prefixes reachable without a password login / without a profile
+# (profile picker and login, plus settings so the app can read config —
+# GET is public, POST is admin-gated)
+_ALLOW_WHEN_AUTH = ('auth.',)
+_ALLOW_WHEN_PROFILE = ('profiles.', 'cache.')
+
+# (module, attribute) for every blueprint, imported and registered in order
+_BLUEPRINTS = (
+    ('app.routes.images', 'images_bp'),
+    ('app.routes.folders', 'folders_bp'),
+    ('app.routes.favorites', 'favorites_bp'),
+    ('app.routes.trash', 'trash_bp'),
+    ('app.routes.cache', 'cache_bp'),
+    ('app.routes.pages', 'pages_bp'),
+    ('app.routes.auth', 'auth_bp'),
+    ('app.routes.seen', 'seen_bp'),
+    ('app.routes.profiles', 'profiles_bp'),
+    ('app.routes.comments', 'comments_bp'),
+)
+
+
 def _ensure_config_files_exist():
     """Create default config files if they don't exist.
 
     This allows users to skip the manual setup step of copying example files.
     Files are created with sensible defaults on first launch.
     """
-    from app.config import CONFIG_FILE, FAVORITES_FILE, TRASH_FILE, SEEN_FILE, COMMENTS_FILE, DEFAULT_OPTIMIZATIONS, PROFILES_DIR, PROFILES_FILE
+    from app.config import CONFIG_FILE, FAVORITES_FILE, TRASH_FILE, DEFAULT_OPTIMIZATIONS, PROFILES_DIR, PROFILES_FILE
+    from app.services.data import migrate_legacy_comments
+    from app.services.json_utils import dumps as json_dumps
 
     defaults = {
         CONFIG_FILE: {
@@ -25,19 +53,93 @@ def _ensure_config_files_exist():
         },
         FAVORITES_FILE: {'favorites': []},
         TRASH_FILE: {'trash': []},
-        SEEN_FILE: {'seen': {}, 'total_scrolls': 0},
         PROFILES_FILE: {'profiles': []},
-        COMMENTS_FILE: {},
     }
 
+    # One listdir of the data directory instead of a stat per file
+    present = set(os.listdir(os.path.dirname(CONFIG_FILE) or '.'))
     for filepath, default_content in defaults.items():
-        if not os.path.exists(filepath):
-            with open(filepath, 'w') as f:
-                json.dump(default_content, f, indent=2)
+        if os.path.basename(filepath) not in present:
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(default_content, indent=True))
 
     # Ensure profiles directory exists
     os.makedirs(PROFILES_DIR, exist_ok=True)
 
+    # Comments moved from comments.json to an append-only log (comments.jsonl)
+    migrate_legacy_comments()
+
+
+def _load_secret_key(project_root):
+    """Return HOMEFEED_SECRET_KEY, or a random key persisted on first run.
+
+    The generated key lives in ``.flask_session/secret.key`` so every worker
+    process (and every restart) signs sessions with the same key instead of
+    each drawing its own and invalidating the others' sessions.
+    """
+    secret = os.environ.get('HOMEFEED_SECRET_KEY')
+    if secret:
+        return secret
+
+    key_path = os.path.join(project_root, '.flask_session', 'secret.key')
+    try:
+        with open(key_path, 'rb') as f:
+            secret = f.read()
+        if secret:
+            return secret
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(key_path), exist_ok=True)
+        secret = os.urandom(32)
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass  # Another worker created it first — use theirs
+        else:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secret)
+            return secret
+
+    # The key file exists but may still be being written by another worker
+    for _ in range(50):
+        with open(key_path, 'rb') as f:
+            secret = f.read()
+        if secret:
+            return secret
+        time.sleep(0.02)
+    raise RuntimeError(f'Session secret key file is empty: {key_path}')
+
+
+def _configure_sessions(app, project_root):
+    """Configure the session backend selected by HOMEFEED_SESSION_BACKEND.
+
+    - ``filesystem`` (default): Flask-Session files in ``.flask_session/``.
+    - ``cookie``: Flask's built-in signed-cookie session.  Session data is tiny
+      (auth flag, CSRF token, profile id), so this avoids all session disk I/O
+      and file locking.  Workers share the key from ``_load_secret_key`` so
+      every worker can verify the cookie signature.
+    - ``redis``: Flask-Session Redis store at ``REDIS_URL``.
+    """
+    backend = os.environ.get('HOMEFEED_SESSION_BACKEND', 'filesystem').lower()
+
+    app.config['SESSION_PERMANENT'] = False  # Session expires when browser closes
+    # Don't re-save an unmodified session on every GET
+    app.config['SESSION_REFRESH_EACH_REQUEST'] = False
+
+    if backend == 'cookie':
+        return
+
+    if backend == 'redis':
+        import redis
+        app.config['SESSION_TYPE'] = 'redis'
+        app.config['SESSION_REDIS'] = redis.Redis.from_url(
+            os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+        )
+        app.config['SESSION_USE_SIGNER'] = True
+    else:
+        app.config['SESSION_TYPE'] = 'filesystem'
+        app.config['SESSION_FILE_DIR'] = os.path.join(project_root, '.flask_session')
+    Session(app)
+
 
 def create_app(config=None):
     """Create and configure the Flask application.
@@ -63,47 +165,48 @@ def create_app(config=None):
     # Load configuration
     if config:
         app.config.update(config)
+
+    # Serialize JSON responses with orjson when available
+    from app.services.json_utils import HAS_ORJSON, ORJSONProvider
+    if HAS_ORJSON:
+        app.json = ORJSONProvider(app)
+    # Keep key order as built and never pretty-print (even in debug mode)
+    app.json.sort_keys = False
+    app.json.compact = True
     
     # Session configuration for authentication
-    app.config['SECRET_KEY'] = os.environ.get('HOMEFEED_SECRET_KEY', os.urandom(24).hex())
-    app.config['SESSION_TYPE'] = 'filesystem'
-    app.config['SESSION_PERMANENT'] = False  # Session expires when browser closes
-    app.config['SESSION_FILE_DIR'] = os.path.join(project_root, '.flask_session')
-    Session(app)
+    app.config['SECRET_KEY'] = _load_secret_key(project_root)
+    _configure_sessions(app, project_root)
     
-    # Enable Gzip compression for API responses
-    # Compresses JSON responses > 500 bytes, achieving 70-80% size reduction
+    # Enable Brotli/Gzip compression for API responses
+    # Compresses JSON responses > 500 bytes, achieving 70-80% size reduction.
+    # Brotli quality 4 compresses JSON about as well as gzip level 6 at
+    # roughly twice the speed; gzip remains the fallback for older clients.
     app.config['COMPRESS_MIN_SIZE'] = 500  # Only compress responses > 500 bytes
-    app.config['COMPRESS_LEVEL'] = 6       # Balance between speed and compression
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_LEVEL'] = 4       # gzip fallback: favour speed
     Compress(app)
     
     # Register blueprints
-    from app.routes.images import images_bp
-    from app.routes.folders import folders_bp
-    from app.routes.favorites import favorites_bp
-    from app.routes.trash import trash_bp
-    from app.routes.cache import cache_bp
-    from app.routes.pages import pages_bp
-    from app.routes.auth import auth_bp
-    from app.routes.seen import seen_bp
-    from app.routes.profiles import profiles_bp
-    from app.routes.comments import comments_bp
-
-    app.register_blueprint(images_bp)
-    app.register_blueprint(folders_bp)
-    app.register_blueprint(favorites_bp)
-    app.register_blueprint(trash_bp)
-    app.register_blueprint(cache_bp)
-    app.register_blueprint(pages_bp)
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(seen_bp)
-    app.register_blueprint(profiles_bp)
-    app.register_blueprint(comments_bp)
+    for module_name, attr in _BLUEPRINTS:
+        module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, attr))
+
+    # Redirect targets used by check_auth never change — build them once
+    # rather than walking the URL map on every unauthenticated request.
+    with app.test_request_context():
+        app.config['LOGIN_URL'] = url_for('auth.login_page')
+        app.config['PROFILE_PICKER_URL'] = url_for('profiles.profile_picker')
 
     # Add authentication and profile checks before each request
     from app.services import is_auth_enabled, is_authenticated
     from app.services.profiles import is_profiles_active, is_profile_selected
 
+    # HOMEFEED_PASSWORD is read from the environment, which doesn't change
+    # while the process runs — resolve it once instead of on every request.
+    app.config['_AUTH_ENABLED'] = is_auth_enabled()
+
     @app.before_request
     def check_auth():
         """Check authentication and profile selection before each request.
@@ -118,18 +221,20 @@ def create_app(config=None):
         - Static files
         """
         # Always allow static files
-        if request.path.startswith('/static/'):
+        if request.path.startswith(_SKIP_PREFIXES):
             return None
 
+        endpoint = request.endpoint or ''
+
         # ---- Step 1: Global password auth ----
-        if is_auth_enabled():
+        if app.config['_AUTH_ENABLED']:
             # Allow auth routes
-            if request.endpoint and request.endpoint.startswith('auth.'):
+            if endpoint.startswith(_ALLOW_WHEN_AUTH):
                 return None
 
             if not is_authenticated():
                 if request.accept_mimetypes.accept_html:
-                    return redirect(url_for('auth.login_page'))
+                    return redirect(app.config['LOGIN_URL'])
                 return jsonify({'error': 'Authentication required'}), 401
 
         # ---- Step 2: Profile selection ----
@@ -139,18 +244,14 @@ def create_app(config=None):
         if not is_profiles_active():
             return None
 
-        # Allow profile routes (picker, login, etc.)
-        if request.endpoint and request.endpoint.startswith('profiles.'):
-            return None
-
-        # Allow settings routes so the app can read config (GET is public; POST is admin-gated)
-        if request.endpoint and request.endpoint.startswith('cache.'):
+        # Allow profile routes (picker, login, etc.) and settings routes
+        if endpoint.startswith(_ALLOW_WHEN_PROFILE):
             return None
 
         # profiles_exist() is already confirmed true by is_profiles_active() above
         if not is_profile_selected():
             if request.accept_mimetypes.accept_html:
-                return redirect(url_for('profiles.profile_picker'))
+                return redirect(app.config['PROFILE_PICKER_URL'])
             return jsonify({'error': 'Profile selection required'}), 401
 
         return None
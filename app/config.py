@@ -3,7 +3,7 @@ Configuration constants and settings for HomeFeed.
 """
 
 import os
-from typing import Set, Dict, Any
+from typing import FrozenSet, Dict, Any
 
 # Base directory for the application
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -13,20 +13,27 @@ CONFIG_FILE = os.path.join(BASE_DIR, 'config.json')
 FAVORITES_FILE = os.path.join(BASE_DIR, 'favorites.json')
 TRASH_FILE = os.path.join(BASE_DIR, 'trash.json')
 THUMBNAIL_DIR = os.path.join(BASE_DIR, '.thumbnails')
-SEEN_FILE = os.path.join(BASE_DIR, 'seen.json')
-COMMENTS_FILE = os.path.join(BASE_DIR, 'comments.json')
+SEEN_FILE = os.path.join(BASE_DIR, 'seen.json')  # legacy, imported into the database below
+SEEN_DB_FILE = os.path.join(BASE_DIR, 'seen.db')
+COMMENTS_FILE = os.path.join(BASE_DIR, 'comments.json')  # legacy, migrated to the log below
+COMMENTS_LOG_FILE = os.path.join(BASE_DIR, 'comments.jsonl')
 
 # Profiles
 PROFILES_FILE = os.path.join(BASE_DIR, 'profiles.json')
 PROFILES_DIR = os.path.join(BASE_DIR, 'profiles')
 
-# Persistent EXIF date cache (survives server restarts, keyed by path:mtime:size)
+# Persistent EXIF date cache (survives server restarts, keyed by path, mtime, size)
+EXIF_DATE_CACHE_DB = os.path.join(BASE_DIR, '.exif_date_cache.db')
+# Legacy JSON EXIF cache, imported into EXIF_DATE_CACHE_DB on first use
 EXIF_DATE_CACHE_FILE = os.path.join(BASE_DIR, '.exif_date_cache.json')
 
+# Last scanned image list, reloaded after a restart instead of rescanning
+IMAGE_LIST_CACHE_FILE = os.path.join(BASE_DIR, '.image_list_cache.json')
+
 # Supported file formats
-SUPPORTED_FORMATS: Set[str] = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.m4v', '.mp4', '.mov'}
-VIDEO_FORMATS: Set[str] = {'.m4v', '.mp4', '.mov', '.webm'}
-GIF_FORMATS: Set[str] = {'.gif'}
+SUPPORTED_FORMATS: FrozenSet[str] = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.m4v', '.mp4', '.mov'})
+VIDEO_FORMATS: FrozenSet[str] = frozenset({'.m4v', '.mp4', '.mov', '.webm'})
+GIF_FORMATS: FrozenSet[str] = frozenset({'.gif'})
 
 # Size limits
 MAX_VIDEO_SIZE = 75 * 1024 * 1024  # 75 MB limit for videos
@@ -39,6 +46,10 @@ THUMBNAIL_QUALITY = 85  # WebP quality (0-100)
 CACHE_TTL = 30  # seconds
 CACHE_TTL_HDD = 300  # seconds — used when hdd_friendly is enabled
 
+# Image URL lists with at least this many entries are streamed as JSON in
+# batches instead of being built and serialized in one piece
+STREAM_JSON_MIN_ITEMS = 20000
+
 # Default optimization settings
 DEFAULT_OPTIMIZATIONS: Dict[str, Any] = {
     'thumbnail_cache': False,
@@ -48,6 +59,7 @@ DEFAULT_OPTIMIZATIONS: Dict[str, Any] = {
     'auto_advance_delay': 3,
     'preload_distance': 3,  # Number of slides to preload ahead (0-10)
     'date_source': 'mtime',  # Filesystem fallback when EXIF date absent: 'mtime' or 'ctime'
+    'exif_dates': True,  # Sort photos by EXIF date; False sorts by filesystem date only (no file reads)
     'hdd_friendly': False,
 }
 
@@ -5,7 +5,8 @@ Provides login/logout endpoints and login page UI.
 """
 
 import os
-from flask import Blueprint, send_file, request, redirect, url_for, session, jsonify
+import hashlib
+from flask import Blueprint, Response, request, redirect, url_for, session, jsonify
 from app.services import (
     is_auth_enabled,
     is_authenticated,
@@ -20,6 +21,14 @@ auth_bp = Blueprint('auth', __name__)
 # Project root directory (where static/ folder is located)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# login.html rarely changes, so read it once at import time and serve it from
+# memory with an ETag and Last-Modified instead of open()/fstat()-ing the file
+# on every visit.
+with open(os.path.join(PROJECT_ROOT, 'static', 'login.html'), 'rb') as _f:
+    _LOGIN_HTML = _f.read()
+    _LOGIN_MTIME = int(os.fstat(_f.fileno()).st_mtime)
+_LOGIN_ETAG = hashlib.md5(_LOGIN_HTML).hexdigest()
+
 
 @auth_bp.route('/login', methods=['GET'])
 def login_page():
@@ -34,9 +43,13 @@ def login_page():
     if is_authenticated():
         return redirect(url_for('pages.index'))
     
-    # Serve the static login.html file
-    login_path = os.path.join(PROJECT_ROOT, 'static', 'login.html')
-    return send_file(login_path)
+    # Serve the cached login.html; Werkzeug turns a matching If-None-Match or
+    # If-Modified-Since into a bodyless 304
+    response = Response(_LOGIN_HTML, mimetype='text/html')
+    response.set_etag(_LOGIN_ETAG)
+    response.last_modified = _LOGIN_MTIME
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
 
 
 @auth_bp.route('/login', methods=['POST'])
@@ -4,6 +4,8 @@ Handles cache management and application settings.
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, request, jsonify
 
 from app.config import (
@@ -12,6 +14,7 @@ from app.config import (
 )
 from app.services.data import (
     load_config,
+    load_config_readonly,
     save_config,
     get_optimization_settings,
     save_optimization_settings,
@@ -21,11 +24,52 @@ from app.services.image_cache import invalidate_cache
 
 cache_bp = Blueprint('cache', __name__)
 
+# Short-lived cache for GET /api/cache so settings-page polling doesn't walk the
+# whole thumbnail tree each time.  Also invalidated when the top-level
+# THUMBNAIL_DIR mtime moves (new thumbnails are written directly into it).
+_CACHE_INFO_TTL = 5.0  # seconds
+_CACHE_INFO = {'ts': 0.0, 'mtime': 0, 'data': None}
+
+# clear_cache deletes through a small thread pool so unlink latency overlaps;
+# below this many files the pool setup costs more than it saves.
+_PARALLEL_DELETE_MIN_FILES = 100
+_DELETE_WORKERS = 8
+
+
+def _remove_file(entry):
+    """Delete one cache file; returns an error dict or None on success."""
+    try:
+        os.remove(entry.path)
+        return None
+    except Exception as e:
+        return {'file': entry.name, 'error': str(e)}
+
+
+def _walk_scandir(root):
+    """Yield a DirEntry for every file under ``root`` (recursive).
+
+    Uses os.scandir so each entry's type and stat info come from the directory
+    listing itself, instead of os.walk + os.path.getsize issuing an extra
+    stat() and path join per file.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
 
 @cache_bp.route('/api/settings', methods=['GET'])
 def get_settings():
     """Get user settings."""
-    config = load_config()
+    config = load_config_readonly()
     return jsonify({
         'shuffle': config.get('shuffle', False),
         'profiles_enabled': config.get('profiles_enabled', False),
@@ -39,7 +83,7 @@ def update_settings():
 
     Permission model:
     - User settings (anyone can change): shuffle, fill_screen, auto_advance, auto_advance_delay, preload_distance
-    - Admin settings (admin-only): profiles_enabled, thumbnail_cache, video_poster_cache, date_source, hdd_friendly
+    - Admin settings (admin-only): profiles_enabled, thumbnail_cache, video_poster_cache, date_source, exif_dates, hdd_friendly
     """
     from app.services.profiles import is_current_profile_admin
 
@@ -61,24 +105,26 @@ def update_settings():
         config['profiles_enabled'] = enabling
 
     if 'optimizations' in data:
-        # Only admins can change date_source and hdd_friendly (system-wide impact)
+        # Only admins can change date_source, exif_dates and hdd_friendly (system-wide impact)
         # Users can change their own preferences (fill_screen, auto_advance, preload_distance)
         current_optimizations = get_optimization_settings()
-        date_source_changed = False
+        dates_changed = False
 
         for key, value in data['optimizations'].items():
             if key in DEFAULT_OPTIMIZATIONS:
                 # System-wide settings: admin only
-                if key in ('date_source', 'hdd_friendly', 'thumbnail_cache', 'video_poster_cache'):
+                if key in ('date_source', 'exif_dates', 'hdd_friendly', 'thumbnail_cache', 'video_poster_cache'):
                     if not is_admin:
                         continue  # Skip non-admin changes to system settings
                     if key == 'date_source':
                         # Validate: only 'mtime' or 'ctime' are accepted
                         if value in ('mtime', 'ctime'):
                             if current_optimizations.get('date_source') != value:
-                                date_source_changed = True
+                                dates_changed = True
                             current_optimizations['date_source'] = value
                     else:
+                        if key == 'exif_dates' and current_optimizations.get('exif_dates', True) != bool(value):
+                            dates_changed = True
                         current_optimizations[key] = bool(value)
                 # User preference settings: anyone can change
                 else:
@@ -89,8 +135,9 @@ def update_settings():
 
         config['optimizations'] = current_optimizations
 
-        # Bust image cache when date_source changes — effective dates must be recomputed
-        if date_source_changed:
+        # Bust image cache when date_source or exif_dates changes — effective
+        # dates must be recomputed
+        if dates_changed:
             invalidate_cache()
 
     save_config(config)
@@ -107,17 +154,25 @@ def update_settings():
 @cache_bp.route('/api/cache', methods=['GET'])
 def get_cache_info():
     """Get information about the cache."""
+    try:
+        mtime = os.stat(THUMBNAIL_DIR).st_mtime_ns
+    except OSError:
+        mtime = 0
+    now = time.monotonic()
+    if (_CACHE_INFO['data'] is not None
+            and now - _CACHE_INFO['ts'] < _CACHE_INFO_TTL
+            and _CACHE_INFO['mtime'] == mtime):
+        return jsonify(_CACHE_INFO['data'])
+
     cache_size = 0
     cache_files = 0
     
-    if os.path.exists(THUMBNAIL_DIR):
-        for root, dirs, files in os.walk(THUMBNAIL_DIR):
-            for f in files:
-                try:
-                    cache_files += 1
-                    cache_size += os.path.getsize(os.path.join(root, f))
-                except OSError:
-                    pass
+    for entry in _walk_scandir(THUMBNAIL_DIR):
+        try:
+            cache_files += 1
+            cache_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
     
     # Format size
     if cache_size < 1024:
@@ -127,11 +182,13 @@ def get_cache_info():
     else:
         size_str = f"{cache_size / (1024 * 1024):.1f} MB"
     
-    return jsonify({
+    data = {
         'files': cache_files,
         'size': cache_size,
         'size_formatted': size_str
-    })
+    }
+    _CACHE_INFO.update(ts=now, mtime=mtime, data=data)
+    return jsonify(data)
 
 
 @cache_bp.route('/api/cache', methods=['DELETE'])
@@ -141,17 +198,17 @@ def clear_cache():
     if not is_current_profile_admin():
         return jsonify({'error': 'Admin role required'}), 403
 
-    deleted_count = 0
-    errors = []
-    
-    if os.path.exists(THUMBNAIL_DIR):
-        for root, dirs, files in os.walk(THUMBNAIL_DIR):
-            for f in files:
-                try:
-                    os.remove(os.path.join(root, f))
-                    deleted_count += 1
-                except Exception as e:
-                    errors.append({'file': f, 'error': str(e)})
+    entries = list(_walk_scandir(THUMBNAIL_DIR))
+    if len(entries) < _PARALLEL_DELETE_MIN_FILES:
+        results = [_remove_file(entry) for entry in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+            results = list(executor.map(_remove_file, entries))
+
+    errors = [r for r in results if r is not None]
+    deleted_count = len(results) - len(errors)
+
+    _CACHE_INFO['ts'] = 0.0
     
     return jsonify({
         'success': True,
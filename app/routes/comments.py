@@ -16,9 +16,10 @@ Endpoints:
 """
 
 import os
-import uuid
+import sys
 import time
-import json
+import secrets
+from functools import lru_cache
 from urllib.parse import unquote
 from flask import Blueprint, request, jsonify
 
@@ -28,13 +29,23 @@ from app.services.data import (
     update_comment,
     delete_comment,
 )
+from app.services.json_utils import loads as json_loads
 from app.services.path_utils import (
+    extract_path_from_url,
     normalize_path,
     is_path_allowed,
     validate_and_normalize_path,
 )
-from app.services.profiles import get_current_profile_id
-from app.services.profiles import is_profiles_active
+from app.services.profiles import (
+    get_current_profile,
+    get_current_profile_id,
+    is_profiles_active,
+)
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large sidecars are then parsed whole
+    ijson = None
 
 
 comments_bp = Blueprint('comments', __name__)
@@ -46,34 +57,133 @@ def _sidecar_path(image_path: str) -> str:
     return base + '.txt'
 
 
-def _read_sidecar(image_path: str):
+# Sidecar parse caches, keyed on (path, mtime_ns, size) so an edited file
+# automatically misses.  Scrolling back and forth over the same images then
+# costs one stat() per sidecar instead of a read + parse.
+
+@lru_cache(maxsize=512)
+def _load_text_sidecar(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Strict decoding is the fast path; only malformed files pay for replacement
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('utf-8', errors='replace')
+
+
+# gallery-dl dumps can be large (full comment trees with every Reddit field).
+# Above this size, stream the file and keep only the fields read below.
+_STREAM_MIN_SIZE = 32 * 1024
+_POST_FIELDS = frozenset(('title', 'selftext', 'body', 'author', 'score', 'date', 'created_utc'))
+_COMMENT_FIELDS = frozenset(('body', 'text', 'id', 'author', 'score', 'created_utc', 'date'))
+_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+
+
+def _stream_json_sidecar(f) -> dict:
+    """Pull the post fields and flat comment fields out of a JSON sidecar.
+
+    Returns a dict shaped like the parsed document but holding only the
+    scalars _read_reddit_sidecar uses.  Non-object entries in ``comments``
+    are kept as None so comment indices (used for fallback ids) match.
+    """
+    data = {}
+    comments = None
+    current = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix == 'comments.item':
+            if event == 'start_map':
+                current = {}
+            elif event == 'end_map':
+                comments.append(current)
+                current = None
+            elif event == 'start_array' or event in _SCALAR_EVENTS:
+                comments.append(None)
+        elif current is not None:
+            if event in _SCALAR_EVENTS:
+                key = prefix[14:]  # strip 'comments.item.'
+                if key in _COMMENT_FIELDS:
+                    current[key] = value
+        elif prefix == 'comments' and event == 'start_array':
+            comments = data['comments'] = []
+        elif prefix in _POST_FIELDS and event in _SCALAR_EVENTS:
+            data[prefix] = value
+    return data
+
+
+@lru_cache(maxsize=2048)
+def _load_json_sidecar(path: str, mtime_ns: int, size: int):
+    with open(path, 'rb') as f:
+        if ijson is not None and size >= _STREAM_MIN_SIZE:
+            try:
+                return _stream_json_sidecar(f)
+            except ijson.JSONError as e:
+                raise ValueError(str(e)) from e
+        return json_loads(f.read())
+
+
+# A directory modified less than this long ago is listed without the cache:
+# on coarse-mtime filesystems (FAT/exFAT 2 s, HFS+ 1 s, some SMB/NFS mounts)
+# another change within the same tick would leave its mtime unchanged
+_DIR_MTIME_GRANULARITY = 2.0
+
+
+def _dir_names(dirname: str) -> frozenset:
+    """Case-normalized names in a directory (empty if it can't be listed)."""
+    try:
+        return frozenset(os.path.normcase(name) for name in os.listdir(dirname))
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=256)
+def _list_dir(dirname: str, mtime_ns: int, ino: int, nlink: int) -> frozenset:
+    """_dir_names(), cached on the directory's stat.
+
+    Adding, removing or renaming a file bumps the directory mtime, so a new
+    or deleted sidecar is picked up on the next request; a replaced
+    directory has a new inode.
+    """
+    return _dir_names(dirname)
+
+
+def _list_dir_cached(dirname: str) -> frozenset:
+    """Return _dir_names(dirname), from the cache once its mtime has settled.
+
+    Raises:
+        OSError: If the directory can't be stat'ed.
+    """
+    st = os.stat(dirname)
+    if time.time() - st.st_mtime < _DIR_MTIME_GRANULARITY:
+        return _dir_names(dirname)
+    return _list_dir(dirname, st.st_mtime_ns, st.st_ino, st.st_nlink)
+
+
+def _read_sidecar(sidecar: str):
     """Read .txt sidecar file content if it exists, else return None."""
-    sidecar = _sidecar_path(image_path)
-    if os.path.exists(sidecar):
-        try:
-            with open(sidecar, 'r', encoding='utf-8', errors='replace') as f:
-                return f.read()
-        except IOError:
-            pass
-    return None
+    try:
+        st = os.stat(sidecar)
+        return _load_text_sidecar(sidecar, st.st_mtime_ns, st.st_size)
+    except IOError:
+        return None
 
 
-def _read_reddit_sidecar(image_path: str):
+def _read_reddit_sidecar(base: str):
     """Read a gallery-dl Reddit JSON sidecar if present.
 
     gallery-dl can download a .json file alongside the image containing post/comment
     data. We look for <basename>.json and try to extract comments from it.
 
+    Args:
+        base: Image path without its extension
+
     Returns a list of comment dicts or None if no sidecar found.
     """
-    base, _ = os.path.splitext(image_path)
     json_path = base + '.json'
-    if not os.path.exists(json_path):
-        return None
     try:
-        with open(json_path, 'r', encoding='utf-8', errors='replace') as f:
-            data = json.load(f)
-    except (IOError, json.JSONDecodeError):
+        st = os.stat(json_path)
+        data = _load_json_sidecar(json_path, st.st_mtime_ns, st.st_size)
+    except (IOError, ValueError):
         return None
 
     comments = []
@@ -120,6 +230,38 @@ def _read_reddit_sidecar(image_path: str):
     return comments if comments else None
 
 
+def _load_sidecars(image_path: str):
+    """Read both sidecars of an image using one cached directory listing.
+
+    Most images have no sidecars at all; checking the (cached) listing of the
+    parent directory answers "is there a .txt / .json?" with a single stat of
+    the directory instead of a failed stat per sidecar.
+
+    Returns:
+        Tuple of (sidecar_text, sidecar_path, reddit_comments); each is None
+        when the corresponding sidecar is absent or unreadable.
+    """
+    dirname, filename = os.path.split(image_path)
+    stem = os.path.splitext(filename)[0]
+    try:
+        names = _list_dir_cached(dirname)
+    except OSError:
+        return None, None, None
+
+    base = os.path.join(dirname, stem)
+    sidecar_text = sidecar_path = reddit_comments = None
+
+    if os.path.normcase(stem + '.txt') in names:
+        sidecar_text = _read_sidecar(base + '.txt')
+        if sidecar_text is not None:
+            sidecar_path = base + '.txt'
+
+    if os.path.normcase(stem + '.json') in names:
+        reddit_comments = _read_reddit_sidecar(base)
+
+    return sidecar_text, sidecar_path, reddit_comments
+
+
 @comments_bp.route('/api/comments', methods=['GET'])
 def get_comments():
     """Get all comments for an image, including sidecar and reddit data.
@@ -140,7 +282,6 @@ def get_comments():
         return jsonify({'error': 'path parameter required'}), 400
 
     # Accept /image?path=... or /thumbnail?path=... or raw paths
-    from app.services.path_utils import extract_path_from_url
     extracted = extract_path_from_url(raw_path)
     image_path = normalize_path(extracted)
 
@@ -150,21 +291,19 @@ def get_comments():
     # User comments stored in comments.json
     user_comments = get_comments_for_path(image_path)
 
-    # Reddit sidecar
-    reddit_comments = _read_reddit_sidecar(image_path)
+    # .txt and Reddit .json sidecars
+    sidecar_text, sidecar_path, reddit_comments = _load_sidecars(image_path)
+
     if reddit_comments:
         # Merge: reddit comments go first (they're source material), user comments after
         all_comments = reddit_comments + [c for c in user_comments if c.get('type') != 'reddit']
     else:
         all_comments = user_comments
 
-    # Sidecar .txt
-    sidecar_text = _read_sidecar(image_path)
-
     return jsonify({
         'comments': all_comments,
         'sidecar': sidecar_text,
-        'sidecar_path': _sidecar_path(image_path) if sidecar_text is not None else None,
+        'sidecar_path': sidecar_path,
         'has_sidecar': sidecar_text is not None,
     })
 
@@ -188,7 +327,6 @@ def post_comment():
     if not text:
         return jsonify({'error': 'text is required'}), 400
 
-    from app.services.path_utils import extract_path_from_url
     extracted = extract_path_from_url(raw_path)
     image_path = normalize_path(extracted)
 
@@ -201,21 +339,14 @@ def post_comment():
     try:
         if is_profiles_active():
             profile_id = get_current_profile_id()
-            if profile_id:
-                from app.services.profiles import load_profiles
-                profiles_data = load_profiles()
-                profile = next(
-                    (p for p in profiles_data.get('profiles', []) if p.get('id') == profile_id),
-                    None
-                )
-                if profile:
-                    profile_name = profile.get('name') or profile.get('emoji') or None
+            profile = get_current_profile()
+            if profile:
+                profile_name = profile.get('name') or profile.get('emoji') or None
     except Exception as e:
-        import sys
         print(f'Warning: Failed to load profile context for comment: {e}', file=sys.stderr)
 
     comment = {
-        'id': str(uuid.uuid4()),
+        'id': secrets.token_hex(12),
         'text': text,
         'type': 'user',
         'profile_id': profile_id,
@@ -244,7 +375,6 @@ def edit_comment(comment_id):
     if not raw_path or not text:
         return jsonify({'error': 'path and text are required'}), 400
 
-    from app.services.path_utils import extract_path_from_url
     extracted = extract_path_from_url(raw_path)
     image_path = normalize_path(extracted)
 
@@ -271,7 +401,6 @@ def remove_comment(comment_id):
     if not raw_path:
         return jsonify({'error': 'path is required'}), 400
 
-    from app.services.path_utils import extract_path_from_url
     extracted = extract_path_from_url(raw_path)
     image_path = normalize_path(extracted)
 
@@ -302,7 +431,6 @@ def update_sidecar():
     if not raw_path:
         return jsonify({'error': 'path is required'}), 400
 
-    from app.services.path_utils import extract_path_from_url
     extracted = extract_path_from_url(raw_path)
     image_path = normalize_path(extracted)
 
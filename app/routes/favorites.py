@@ -7,7 +7,7 @@ Falls back to global favorites.json when profiles are not in use.
 """
 
 import os
-from urllib.parse import quote, unquote
+from urllib.parse import unquote
 from flask import Blueprint, request, jsonify
 
 from app.services.data import (
@@ -17,10 +17,12 @@ from app.services.data import (
     load_active_trash,
     save_active_trash,
 )
+from app.services.json_utils import ojsonify
 from app.services.path_utils import (
     normalize_path,
     is_path_allowed,
     format_image_url,
+    format_full_image_url,
     extract_path_from_url,
 )
 
@@ -33,8 +35,8 @@ def get_favorites():
     """Get list of favorited image paths (as URL paths for frontend compatibility)."""
     favorites = cleanup_active_favorites()
     # Convert to URL format for frontend (URL-encoded for Windows paths)
-    favorite_urls = [f'/image?path={quote(img, safe="")}' for img in favorites]
-    return jsonify({'favorites': favorite_urls})
+    favorite_urls = [format_full_image_url(img) for img in favorites]
+    return ojsonify({'favorites': favorite_urls})
 
 
 @favorites_bp.route('/api/favorites', methods=['POST'])
@@ -88,7 +90,7 @@ def get_favorite_images():
     favorites.sort(key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0, reverse=(sort_order == 'newest'))
     # URL-encode paths for Windows compatibility
     image_urls = [format_image_url(img) for img in favorites]
-    return jsonify(image_urls)
+    return ojsonify(image_urls)
 
 
 @favorites_bp.route('/api/favorites/images/folder', methods=['GET'])
@@ -116,7 +118,7 @@ def get_favorite_images_by_folder():
 
     # Return as URLs
     image_urls = [format_image_url(img) for img in filtered]
-    return jsonify(image_urls)
+    return ojsonify(image_urls)
 
 
 @favorites_bp.route('/api/favorites/count', methods=['GET'])
@@ -7,10 +7,12 @@ Falls back to global config when profiles are not in use.
 """
 
 import os
+import stat
 from flask import Blueprint, request, jsonify
 
 from app.services.path_utils import normalize_path, expand_path, is_path_allowed
 from app.services.image_cache import get_leaf_folders, invalidate_cache
+from app.services.json_utils import ojsonify
 from app.services.profiles import (
     get_current_profile_id,
     is_profiles_active,
@@ -26,48 +28,40 @@ folders_bp = Blueprint('folders', __name__)
 
 
 def _get_active_folders():
-    """Return (folders_list, save_fn) for the active profile or global config.
+    """Return (folders_list, profile_id) for the active folder list.
 
-    Admin profiles write to the global config (same as the vanilla experience).
-    Regular profiles write to their own per-profile config.
+    profile_id is None when the list comes from the global config — with no
+    profile active, or for admin profiles, which manage the global list (same
+    as the vanilla experience).  Pass it back to _save_folders() to persist
+    changes to the same place.
     """
     profile_id = get_current_profile_id()
-    if profile_id and is_profiles_active():
-        if is_current_profile_admin():
-            # Admins manage the global folder list
-            config = load_config()
-            folders = config.get('folders', [])
+    if profile_id and is_profiles_active() and not is_current_profile_admin():
+        return load_profile_config(profile_id).get('folders', []), profile_id
+    return load_config().get('folders', []), None
 
-            def save_fn(updated_folders):
-                config['folders'] = updated_folders
-                save_config(config)
 
-            return folders, save_fn
+def _save_folders(profile_id, folders):
+    """Save a folder list returned by _get_active_folders().
 
-        config = load_profile_config(profile_id)
-        folders = config.get('folders', [])
-
-        def save_fn(updated_folders):
-            config['folders'] = updated_folders
-            save_profile_config(profile_id, config)
-
-        return folders, save_fn
-    else:
+    Regular profiles write to their own per-profile config; profile_id None
+    writes to the global config.
+    """
+    if profile_id is None:
         config = load_config()
-        folders = config.get('folders', [])
-
-        def save_fn(updated_folders):
-            config['folders'] = updated_folders
-            save_config(config)
-
-        return folders, save_fn
+        config['folders'] = folders
+        save_config(config)
+    else:
+        config = load_profile_config(profile_id)
+        config['folders'] = folders
+        save_profile_config(profile_id, config)
 
 
 @folders_bp.route('/api/folders', methods=['GET'])
 def get_folders():
     """Get list of configured folders for the current profile (or global)."""
     folders, _ = _get_active_folders()
-    return jsonify(folders)
+    return ojsonify(folders)
 
 
 @folders_bp.route('/api/folders/leaf', methods=['GET'])
@@ -79,7 +73,7 @@ def get_leaf_folders_route():
     Sorting is handled by the frontend.
     """
     folders = get_leaf_folders()
-    return jsonify(folders)
+    return ojsonify(folders)
 
 
 @folders_bp.route('/api/folders/settings', methods=['GET'])
@@ -117,10 +111,15 @@ def add_folder():
     # Expand ~ and validate path
     expanded_path = expand_path(path)
 
-    if not os.path.isdir(expanded_path):
+    # One stat() both checks existence and that it is a directory
+    try:
+        is_dir = stat.S_ISDIR(os.stat(expanded_path).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
         return jsonify({'error': f'Folder not found: {expanded_path}'}), 400
 
-    folders, save_fn = _get_active_folders()
+    folders, profile_id = _get_active_folders()
 
     # Normalize path for storage (use expanded path)
     normalized = os.path.normpath(expanded_path)
@@ -129,7 +128,7 @@ def add_folder():
         return jsonify({'error': 'Folder already added'}), 400
 
     folders.append(normalized)
-    save_fn(folders)
+    _save_folders(profile_id, folders)
 
     # Invalidate cache since folders changed
     invalidate_cache()
@@ -146,14 +145,14 @@ def remove_folder():
     if not path:
         return jsonify({'error': 'Path is required'}), 400
 
-    folders, save_fn = _get_active_folders()
+    folders, profile_id = _get_active_folders()
 
     # Normalize the path to match stored format
     normalized = os.path.normpath(expand_path(path))
 
     if normalized in folders:
         folders.remove(normalized)
-        save_fn(folders)
+        _save_folders(profile_id, folders)
         remove_folder_setting(normalized)
 
         # Invalidate cache since folders changed
@@ -25,7 +25,11 @@ from app.services.path_utils import (
     validate_and_normalize_path,
     format_image_url,
 )
-from app.services.image_cache import get_all_images, get_images_by_folder
+from app.services.image_cache import (
+    get_all_images,
+    get_all_images_with_urls,
+    get_images_by_folder,
+)
 from app.services.optimizations import (
     ensure_thumbnail_dir,
     get_thumbnail_path,
@@ -33,6 +37,7 @@ from app.services.optimizations import (
     create_video_poster,
 )
 from app.services.data import get_optimization_settings
+from app.services.json_utils import ojsonify
 
 
 images_bp = Blueprint('images', __name__)
@@ -42,16 +47,16 @@ images_bp = Blueprint('images', __name__)
 def get_images():
     """Get list of all images from configured folders."""
     sort_order = request.args.get('sort', 'newest')
-    images = get_all_images()
+    # Relative URLs for the images (URL-encoded for Windows paths), cached
+    # alongside the image list
+    _, image_urls = get_all_images_with_urls()
     
     # Sort images if needed
     if sort_order == 'oldest':
         # Reverse the order (oldest first)
-        images = images[::-1]
+        image_urls = image_urls[::-1]
     
-    # Return relative URLs for the images (URL-encoded for Windows paths)
-    image_urls = [format_image_url(img) for img in images]
-    return jsonify(image_urls)
+    return ojsonify(image_urls)
 
 
 @images_bp.route('/api/images/folder', methods=['GET'])
@@ -80,7 +85,7 @@ def get_images_by_folder_route():
     
     # Return as URLs
     image_urls = [format_image_url(img) for img in filtered_images]
-    return jsonify(image_urls)
+    return ojsonify(image_urls)
 
 
 @images_bp.route('/api/images/subtree', methods=['GET'])
@@ -117,14 +122,14 @@ def get_images_by_subtree_route():
         filtered = filtered[::-1]
 
     image_urls = [format_image_url(img) for img in filtered]
-    return jsonify(image_urls)
+    return ojsonify(image_urls)
 
 
 @images_bp.route('/api/image-count', methods=['GET'])
 def get_image_count():
     """Get count of images and folders."""
-    from app.services.data import load_config
-    config = load_config()
+    from app.services.data import load_config_readonly
+    config = load_config_readonly()
     images = get_all_images()
     return jsonify({
         'imageCount': len(images),
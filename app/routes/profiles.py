@@ -22,9 +22,10 @@ from app.services.profiles import (
     is_current_profile_admin,
     is_profile_selected,
     load_profile_config,
+    load_profile_config_readonly,
     save_profile_config,
 )
-from app.services.data import load_config
+from app.services.data import load_config_readonly, get_global_folder_set
 
 profiles_bp = Blueprint('profiles', __name__)
 
@@ -43,7 +44,9 @@ def profile_picker():
     so the user can create their first profile.
     """
     picker_path = os.path.join(PROJECT_ROOT, 'static', 'profiles.html')
-    return send_file(picker_path)
+    # ETag/Last-Modified let revisits revalidate to a bodyless 304; max_age
+    # matches the login page so a quick back-and-forth skips the request
+    return send_file(picker_path, conditional=True, max_age=300)
 
 
 # ---------------------------------------------------------------------------
@@ -234,10 +237,10 @@ def get_profile_folders_route(profile_id):
         return jsonify({'error': 'Profile not found'}), 404
 
     if profile.get('role') == 'admin':
-        config = load_config()
+        config = load_config_readonly()
         return jsonify({'folders': config.get('folders', []), 'is_global': True})
 
-    config = load_profile_config(profile_id)
+    config = load_profile_config_readonly(profile_id)
     return jsonify({'folders': config.get('folders', []), 'is_global': False})
 
 
@@ -263,9 +266,8 @@ def set_profile_folders_route(profile_id):
         return jsonify({'error': 'folders must be a list'}), 400
 
     # Only allow folders that exist in the global config
-    global_config = load_config()
-    global_folders = set(global_config.get('folders', []))
-    validated = [f for f in folders if f in global_folders]
+    global_folders = get_global_folder_set()
+    validated = list(filter(global_folders.__contains__, folders))
 
     config = load_profile_config(profile_id)
     config['folders'] = validated
@@ -3,24 +3,22 @@ Seen/Unseen image tracking routes for HomeFeed.
 Handles marking images as seen, retrieving stats, and serving the unseen feed.
 
 When profiles are active, reads and writes the current profile's seen history.
-Falls back to global seen.json when profiles are not in use.
+Falls back to the global seen.db when profiles are not in use.
 """
 
 from urllib.parse import quote
 from flask import Blueprint, request, jsonify
 
+from app.config import STREAM_JSON_MIN_ITEMS
 from app.services.data import (
-    load_active_seen,
+    load_active_seen_keys,
     mark_active_seen_batch,
     get_active_seen_stats,
     reset_active_seen,
 )
-from app.services.image_cache import get_all_images
-from app.services.path_utils import (
-    normalize_path,
-    extract_path_from_url,
-    format_image_url,
-)
+from app.services.image_cache import get_all_images, get_all_images_with_urls
+from app.services.json_utils import ojsonify, ojsonify_stream
+from app.services.path_utils import normalize_path, extract_path_from_url
 
 
 seen_bp = Blueprint('seen', __name__)
@@ -42,19 +40,16 @@ def mark_seen():
     if not isinstance(raw_paths, list) or len(raw_paths) == 0:
         return jsonify({'error': 'paths array is required'}), 400
 
-    # Normalize: accept either URL format (/image?path=...) or raw paths
-    normalized = []
-    for p in raw_paths:
-        extracted = extract_path_from_url(p)
-        norm = normalize_path(extracted)
-        if norm:
-            normalized.append(norm)
+    # Normalize: accept either URL format (/image?path=...) or raw paths.
+    # map/filter keep the per-path loop in C; both helpers are memoized or
+    # short-circuit for raw paths, and filter(None) drops empty results.
+    normalized = list(filter(None, map(normalize_path, map(extract_path_from_url, raw_paths))))
 
     updated = mark_active_seen_batch(normalized)
     return jsonify({
         'success': True,
         'total_scrolls': updated.get('total_scrolls', 0),
-        'seen_count': len(updated.get('seen', {})),
+        'seen_count': updated.get('seen_count', 0),
     })
 
 
@@ -89,20 +84,21 @@ def get_unseen_images():
     """
     sort_order = request.args.get('sort', 'newest')
 
-    all_images = get_all_images()
-
-    seen_data = load_active_seen()
-    # Build a set of normalized seen paths for fast lookup
-    seen_set = set(normalize_path(p) for p in seen_data.get('seen', {}).keys())
+    all_images, all_urls = get_all_images_with_urls()
 
-    # Filter: keep only images that are NOT in seen_set
-    unseen = [img for img in all_images if normalize_path(img) not in seen_set]
+    # Seen paths are stored normalized (see mark_seen) and scanned image paths
+    # are normalized too, so the seen keys themselves are the lookup table.
+    seen = load_active_seen_keys()
 
     # Sort: all_images is already sorted newest-first from cache;
-    # for oldest-first, reverse.
+    # for oldest-first, iterate it in reverse (no copy).
     if sort_order == 'oldest':
-        unseen = list(reversed(unseen))
-
-    # Convert to URL format
-    image_urls = [format_image_url(img) for img in unseen]
-    return jsonify(image_urls)
+        ordered = zip(reversed(all_images), reversed(all_urls))
+    else:
+        ordered = zip(all_images, all_urls)
+
+    # Filter out seen images, taking each URL from the cached parallel list
+    image_urls = (url for img, url in ordered if img not in seen)
+    if len(all_images) >= STREAM_JSON_MIN_ITEMS:
+        return ojsonify_stream(image_urls)
+    return ojsonify(list(image_urls))
@@ -7,9 +7,12 @@ Falls back to global trash.json when profiles are not in use.
 """
 
 import os
-from urllib.parse import quote, unquote
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from urllib.parse import unquote
 from flask import Blueprint, request, jsonify
 
+from app.config import STREAM_JSON_MIN_ITEMS
 from app.services.data import (
     load_active_favorites,
     save_active_favorites,
@@ -22,22 +25,42 @@ from app.services.path_utils import (
     normalize_path,
     is_path_allowed,
     format_image_url,
+    format_full_image_url,
     extract_path_from_url,
 )
 from app.services.image_cache import invalidate_cache
+from app.services.json_utils import ojsonify, ojsonify_stream
 from app.services.profiles import is_current_profile_admin
 
 
 trash_bp = Blueprint('trash', __name__)
 
+# empty_trash switches to a thread pool at this many files
+_PARALLEL_DELETE_MIN_FILES = 32
+_DELETE_WORKERS = 16
+
+
+def _remove_trashed_file(img_path):
+    """Delete one trashed file.
+
+    Returns True if deleted, False if it was already gone, or an error dict.
+    """
+    try:
+        os.remove(img_path)
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        return {'path': img_path, 'error': str(e)}
+
 
 @trash_bp.route('/api/trash', methods=['GET'])
 def get_trash():
     """Get list of trashed image paths (as URL paths for frontend compatibility)."""
     trash = cleanup_active_trash()
     # Convert to URL format for frontend (URL-encoded for Windows paths)
-    trash_urls = [f'/image?path={quote(img, safe="")}' for img in trash]
-    return jsonify({'trash': trash_urls})
+    trash_urls = [format_full_image_url(img) for img in trash]
+    return ojsonify({'trash': trash_urls})
 
 
 @trash_bp.route('/api/trash', methods=['POST'])
@@ -93,11 +116,19 @@ def get_trash_images():
     """Get trashed images as URLs (filtered to existing files only)."""
     sort_order = request.args.get('sort', 'newest')
     trash = cleanup_active_trash()
-    # Sort by modification time
-    trash.sort(key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0, reverse=(sort_order == 'newest'))
+    # Sort by modification time — one stat per file, missing files sort as 0
+    entries = []
+    for img in trash:
+        try:
+            entries.append((os.stat(img).st_mtime, img))
+        except OSError:
+            entries.append((0.0, img))
+    entries.sort(key=itemgetter(0), reverse=(sort_order == 'newest'))
     # URL-encode paths for Windows compatibility
-    image_urls = [format_image_url(img) for img in trash]
-    return jsonify(image_urls)
+    image_urls = (format_image_url(img) for _, img in entries)
+    if len(entries) >= STREAM_JSON_MIN_ITEMS:
+        return ojsonify_stream(image_urls)
+    return ojsonify(list(image_urls))
 
 
 @trash_bp.route('/api/trash/count', methods=['GET'])
@@ -119,16 +150,15 @@ def empty_trash():
 
     trash = load_active_trash()
 
-    deleted_count = 0
-    errors = []
+    # Removes are I/O-bound (slow on HDD/NAS), so overlap them for big trash lists
+    if len(trash) < _PARALLEL_DELETE_MIN_FILES:
+        results = [_remove_trashed_file(img_path) for img_path in trash]
+    else:
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+            results = list(executor.map(_remove_trashed_file, trash))
 
-    for img_path in trash:
-        try:
-            if os.path.exists(img_path):
-                os.remove(img_path)
-                deleted_count += 1
-        except Exception as e:
-            errors.append({'path': img_path, 'error': str(e)})
+    deleted_count = results.count(True)
+    errors = [r for r in results if isinstance(r, dict)]
 
     # Clear the trash list after deletion attempt
     save_active_trash([])
@@ -9,10 +9,12 @@ from app.services.path_utils import (
     is_path_allowed,
     validate_and_normalize_path,
     format_image_url,
+    format_full_image_url,
     extract_path_from_url,
 )
 from app.services.image_cache import (
     get_all_images,
+    get_all_images_with_urls,
     get_folder_mtime,
     invalidate_cache,
     get_images_by_folder,
@@ -26,6 +28,7 @@ from app.services.optimizations import (
 )
 from app.services.data import (
     load_config,
+    load_config_readonly,
     save_config,
     get_optimization_settings,
     save_optimization_settings,
@@ -54,9 +57,11 @@ __all__ = [
     'is_path_allowed',
     'validate_and_normalize_path',
     'format_image_url',
+    'format_full_image_url',
     'extract_path_from_url',
     # Image cache
     'get_all_images',
+    'get_all_images_with_urls',
     'get_folder_mtime',
     'invalidate_cache',
     'get_images_by_folder',
@@ -68,6 +73,7 @@ __all__ = [
     'create_video_poster',
     # Data management
     'load_config',
+    'load_config_readonly',
     'save_config',
     'get_optimization_settings',
     'save_optimization_settings',
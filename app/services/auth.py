@@ -6,6 +6,7 @@ Password is set via the HOMEFEED_PASSWORD environment variable.
 """
 
 import os
+import hmac
 import secrets
 from functools import wraps
 from flask import session, request, redirect, url_for, jsonify
@@ -29,6 +30,18 @@ def get_password():
     return os.environ.get('HOMEFEED_PASSWORD', '')
 
 
+def _password_matches(password):
+    """Compare a submitted password with the configured one in constant time.
+
+    hmac.compare_digest on UTF-8 bytes takes the same time however many
+    leading characters match, and (unlike on str) accepts non-ASCII input.
+    """
+    expected = get_password()
+    if not expected or not isinstance(password, str):
+        return False
+    return hmac.compare_digest(password.encode('utf-8'), expected.encode('utf-8'))
+
+
 def is_authenticated():
     """Check if the current session is authenticated."""
     return session.get(SESSION_KEY, False)
@@ -44,7 +57,9 @@ def generate_csrf_token():
 def validate_csrf_token(token):
     """Validate a CSRF token against the session token."""
     session_token = session.get(CSRF_TOKEN_KEY)
-    return session_token and secrets.compare_digest(token, session_token)
+    if not session_token or not isinstance(token, str):
+        return False
+    return hmac.compare_digest(token.encode('utf-8'), session_token.encode('utf-8'))
 
 
 @auth.verify_password
@@ -56,7 +71,7 @@ def verify_password(username, password):
     if not is_auth_enabled():
         return True  # Auth disabled, allow all
     
-    if password == get_password():
+    if _password_matches(password):
         session[SESSION_KEY] = True
         return username
     return None
@@ -97,7 +112,7 @@ def session_login(password):
     if not is_auth_enabled():
         return True  # Auth disabled, always succeed
     
-    if password == get_password():
+    if _password_matches(password):
         session[SESSION_KEY] = True
         generate_csrf_token()
         return True
@@ -5,19 +5,30 @@ Handles loading and saving configuration, favorites, trash, and seen data.
 
 import copy
 import os
-import json
 import time
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Set, Tuple
 from filelock import FileLock
+from flask import g
 
 from app.config import (
     CONFIG_FILE,
     FAVORITES_FILE,
     TRASH_FILE,
-    SEEN_FILE,
+    SEEN_DB_FILE,
     COMMENTS_FILE,
+    COMMENTS_LOG_FILE,
     DEFAULT_OPTIMIZATIONS,
 )
+from app.services import seen_db
+from app.services.profiles import get_current_profile_id, is_profiles_active, get_profile_data_file
+from app.services.json_utils import (
+    dumps as json_dumps,
+    loads as json_loads,
+    load_file as json_load_file,
+    write_file as json_write_file,
+)
 
 # ---------------------------------------------------------------------------
 # In-memory config cache
@@ -29,12 +40,42 @@ from app.config import (
 # ---------------------------------------------------------------------------
 
 _CONFIG_CACHE_TTL = 60.0  # seconds between forced re-reads from disk
-# Stored as a tuple (data_dict, timestamp) so replacement is one atomic
+# Stored as a tuple (data_dict, monotonic timestamp) so replacement is one atomic
 # assignment (safe under CPython's GIL without an explicit lock).
 _config_cache: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+# frozenset of config['folders'], tied to the config dict it was built from
+_global_folder_set: Tuple[Optional[Dict[str, Any]], FrozenSet[str]] = (None, frozenset())
+# config['optimizations'] merged over DEFAULT_OPTIMIZATIONS, tied the same way
+_merged_optimizations: Tuple[Optional[Dict[str, Any]], Dict[str, Any]] = (None, {})
+
+
+def load_config_readonly() -> Dict[str, Any]:
+    """Return the shared cached config dict, re-reading it when expired.
+
+    For read-only callers: skips load_config()'s deep copy.  The returned
+    dict (and everything nested in it) is the cache itself and must not be
+    modified — use load_config() for anything that edits and saves.
+    """
+    global _config_cache
+    cached_data, cached_ts = _config_cache
+    if cached_data is not None and (time.monotonic() - cached_ts) < _CONFIG_CACHE_TTL:
+        return cached_data
 
-# Sentinel for per-request g-cache "not set" checks
-_UNSET = object()
+    # Cache miss or expired — read from disk
+    result = _read_config_file()
+    _config_cache = (result, time.monotonic())
+    return result
+
+
+def _read_config_file() -> Dict[str, Any]:
+    """Parse config.json from disk, bypassing the cache."""
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                return json_loads(f.read())
+        except (ValueError, IOError):
+            pass
+    return {'folders': [], 'shuffle': False}
 
 
 def load_config() -> Dict[str, Any]:
@@ -46,23 +87,22 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Configuration dictionary with 'folders' and 'shuffle' keys
     """
-    global _config_cache
-    cached_data, cached_ts = _config_cache
-    if cached_data is not None and (time.time() - cached_ts) < _CONFIG_CACHE_TTL:
-        return copy.deepcopy(cached_data)
+    return copy.deepcopy(load_config_readonly())
 
-    # Cache miss or expired — read from disk
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                result = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            result = {'folders': [], 'shuffle': False}
-    else:
-        result = {'folders': [], 'shuffle': False}
 
-    _config_cache = (result, time.time())
-    return copy.deepcopy(result)
+def get_global_folder_set() -> FrozenSet[str]:
+    """Return the global config's folder list as a frozenset.
+
+    Rebuilt only when the config cache is refreshed or saved, so membership
+    checks don't need a deep copy of the whole config per call.
+    """
+    global _global_folder_set
+    config = load_config_readonly()
+    cached_config, folder_set = _global_folder_set
+    if cached_config is not config:
+        folder_set = frozenset(config.get('folders', ()))
+        _global_folder_set = (config, folder_set)
+    return folder_set
 
 
 def save_config(config: Dict[str, Any]) -> None:
@@ -74,15 +114,13 @@ def save_config(config: Dict[str, Any]) -> None:
     global _config_cache
     lock = FileLock(CONFIG_FILE + '.lock')
     with lock:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        json_write_file(CONFIG_FILE, config, indent=True)
     # Update module-level cache so subsequent reads don't need to hit disk
-    _config_cache = (copy.deepcopy(config), time.time())
+    _config_cache = (copy.deepcopy(config), time.monotonic())
     # Invalidate the per-request g-cache so the rest of this request sees the
     # updated settings (e.g. after toggling thumbnail_cache in settings).
     try:
-        from flask import g
-        g._homefeed_optimization_settings = _UNSET  # force recompute
+        g.pop('_homefeed_optimization_settings', None)  # force recompute
     except RuntimeError:
         pass
 
@@ -96,23 +134,25 @@ def get_optimization_settings() -> Dict[str, bool]:
     Returns:
         Dictionary of optimization settings
     """
+    global _merged_optimizations
+    # Plain attribute access: a miss raises AttributeError (first call in a
+    # request) or RuntimeError (outside a request context)
     try:
-        from flask import g
-        cached = getattr(g, '_homefeed_optimization_settings', _UNSET)
-        if cached is not _UNSET:
-            return cached
-    except RuntimeError:
-        pass  # Outside request context
+        return g._homefeed_optimization_settings
+    except (AttributeError, RuntimeError):
+        pass
 
-    config = load_config()
-    optimizations = config.get('optimizations', {})
-    # Apply defaults for any missing settings
-    for key, value in DEFAULT_OPTIMIZATIONS.items():
-        if key not in optimizations:
-            optimizations[key] = value
+    # Defaults are merged once per config cache refresh; each request gets
+    # a shallow copy (values are scalars) because callers such as
+    # update_settings edit the returned dict before saving
+    config = load_config_readonly()
+    cached_config, merged = _merged_optimizations
+    if cached_config is not config:
+        merged = {**DEFAULT_OPTIMIZATIONS, **config.get('optimizations', {})}
+        _merged_optimizations = (config, merged)
+    optimizations = dict(merged)
 
     try:
-        from flask import g
         g._homefeed_optimization_settings = optimizations
     except RuntimeError:
         pass
@@ -121,11 +161,24 @@ def get_optimization_settings() -> Dict[str, bool]:
 
 def save_optimization_settings(settings: Dict[str, bool]) -> None:
     """Save optimization settings to config.
-    
+
+    Skipped when config.json already holds these settings.  The comparison
+    is against a fresh read of the file, not this worker's cached config,
+    which may predate another worker's save.
+
     Args:
         settings: Dictionary of optimization settings to save
     """
-    config = load_config()
+    global _config_cache
+    config = _read_config_file()
+    if config.get('optimizations') == settings:
+        # Unchanged on disk — just bring this worker's caches up to date
+        _config_cache = (config, time.monotonic())
+        try:
+            g.pop('_homefeed_optimization_settings', None)
+        except RuntimeError:
+            pass
+        return
     config['optimizations'] = settings
     save_config(config)
 
@@ -171,20 +224,118 @@ def remove_folder_setting(path: str) -> None:
         save_config(config)
 
 
+# ---------------------------------------------------------------------------
+# Existence checks for cleanup_*
+# Favorites, trash and comments tend to cluster in a few directories, so
+# listing each directory once replaces one stat() per entry.  Directories
+# holding only a handful of entries are still stat()ed per entry, since
+# listing a large directory for one file costs more than the stat.
+# Directories are checked on a thread pool when there are many of them:
+# scandir/stat release the GIL, so slow disks and network shares overlap.
+# Repeat cleanups of an unchanged data file are skipped for a short window.
+# ---------------------------------------------------------------------------
+
+_SCANDIR_MIN_ENTRIES = 8
+# _existing_paths switches to a thread pool at this many directories
+_PARALLEL_CHECK_MIN_DIRS = 8
+_CHECK_WORKERS = 16
+
+# A cleanup of an unchanged data file within this many seconds of the last
+# one skips the existence pass (files deleted outside the app are picked up
+# once the window expires)
+_CLEANUP_RECHECK_SECONDS = 60.0
+# data file path -> (mtime_ns, size, time of last cleanup)
+_cleanup_fingerprints: Dict[str, Tuple[int, int, float]] = {}
+
+
+def _file_fingerprint(filepath: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for filepath, or None if it can't be stat()ed."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cleanup_is_fresh(filepath: str) -> bool:
+    """True if filepath was cleaned recently and hasn't changed since."""
+    cached = _cleanup_fingerprints.get(filepath)
+    if cached is None or time.monotonic() - cached[2] >= _CLEANUP_RECHECK_SECONDS:
+        return False
+    return _file_fingerprint(filepath) == cached[:2]
+
+
+def _mark_cleaned(filepath: str) -> None:
+    """Record filepath's current fingerprint after a cleanup pass."""
+    fingerprint = _file_fingerprint(filepath)
+    if fingerprint is None:
+        _cleanup_fingerprints.pop(filepath, None)
+    else:
+        _cleanup_fingerprints[filepath] = (*fingerprint, time.monotonic())
+
+
+def _dir_names(dirname: str) -> FrozenSet[str]:
+    """Return the normcased names in dirname that os.path.exists() accepts.
+
+    Symlinks are only included when their target exists, matching
+    os.path.exists().
+
+    Raises:
+        OSError: If the directory can't be listed.
+    """
+    names = set()
+    with os.scandir(dirname or '.') as it:
+        for entry in it:
+            if entry.is_symlink() and not os.path.exists(entry.path):
+                continue
+            names.add(os.path.normcase(entry.name))
+    return frozenset(names)
+
+
+def _existing_in_dir(dirname: str, dir_paths: List[str]) -> List[str]:
+    """Return the entries of dir_paths (all inside dirname) that exist."""
+    if len(dir_paths) < _SCANDIR_MIN_ENTRIES:
+        return [p for p in dir_paths if os.path.exists(p)]
+    try:
+        names = _dir_names(dirname)
+    except OSError:
+        # Not listable (e.g. traverse-only permission, or out of file
+        # descriptors): check each path, so nothing is wrongly dropped
+        return [p for p in dir_paths if os.path.exists(p)]
+    return [p for p in dir_paths if os.path.normcase(os.path.basename(p)) in names]
+
+
+def _existing_paths(paths: Iterable[str]) -> Set[str]:
+    """Return the subset of paths that exist on disk.
+
+    Equivalent to ``{p for p in paths if os.path.exists(p)}`` for file paths,
+    but lists each directory with enough entries once instead of calling
+    stat() for every path.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    if len(by_dir) < _PARALLEL_CHECK_MIN_DIRS:
+        results = [_existing_in_dir(d, dir_paths) for d, dir_paths in by_dir.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=_CHECK_WORKERS) as executor:
+            results = list(executor.map(_existing_in_dir, by_dir.keys(), by_dir.values()))
+
+    existing = set()
+    for dir_existing in results:
+        existing.update(dir_existing)
+    return existing
+
+
 def load_favorites() -> List[str]:
     """Load favorites from favorites.json.
     
     Returns:
         List of favorited image paths
     """
-    if os.path.exists(FAVORITES_FILE):
-        try:
-            with open(FAVORITES_FILE, 'r') as f:
-                data = json.load(f)
-                return data.get('favorites', [])
-        except (json.JSONDecodeError, IOError):
-            return []
-    return []
+    data = _load_json_file(FAVORITES_FILE, {'favorites': []})
+    return list(data.get('favorites', []))
 
 
 def save_favorites(favorites: List[str]) -> None:
@@ -193,10 +344,7 @@ def save_favorites(favorites: List[str]) -> None:
     Args:
         favorites: List of favorited image paths
     """
-    lock = FileLock(FAVORITES_FILE + '.lock')
-    with lock:
-        with open(FAVORITES_FILE, 'w') as f:
-            json.dump({'favorites': favorites}, f, indent=2)
+    _save_json_file(FAVORITES_FILE, {'favorites': favorites})
 
 
 def cleanup_favorites() -> List[str]:
@@ -210,14 +358,15 @@ def cleanup_favorites() -> List[str]:
         List of valid favorites
     """
     favorites = load_favorites()
+    if _cleanup_is_fresh(FAVORITES_FILE):
+        return favorites
     
-    valid_favorites = []
-    for img_path in favorites:
-        if os.path.exists(img_path):
-            valid_favorites.append(img_path)
+    existing = _existing_paths(favorites)
+    valid_favorites = [img_path for img_path in favorites if img_path in existing]
     
     if len(valid_favorites) != len(favorites):
         save_favorites(valid_favorites)
+    _mark_cleaned(FAVORITES_FILE)
     
     return valid_favorites
 
@@ -228,14 +377,8 @@ def load_trash() -> List[str]:
     Returns:
         List of trashed image paths
     """
-    if os.path.exists(TRASH_FILE):
-        try:
-            with open(TRASH_FILE, 'r') as f:
-                data = json.load(f)
-                return data.get('trash', [])
-        except (json.JSONDecodeError, IOError):
-            return []
-    return []
+    data = _load_json_file(TRASH_FILE, {'trash': []})
+    return list(data.get('trash', []))
 
 
 def save_trash(trash: List[str]) -> None:
@@ -244,10 +387,7 @@ def save_trash(trash: List[str]) -> None:
     Args:
         trash: List of trashed image paths
     """
-    lock = FileLock(TRASH_FILE + '.lock')
-    with lock:
-        with open(TRASH_FILE, 'w') as f:
-            json.dump({'trash': trash}, f, indent=2)
+    _save_json_file(TRASH_FILE, {'trash': trash})
 
 
 def cleanup_trash() -> List[str]:
@@ -257,50 +397,38 @@ def cleanup_trash() -> List[str]:
         List of valid trash entries
     """
     trash = load_trash()
+    if _cleanup_is_fresh(TRASH_FILE):
+        return trash
     
-    valid_trash = []
-    for img_path in trash:
-        if os.path.exists(img_path):
-            valid_trash.append(img_path)
+    existing = _existing_paths(trash)
+    valid_trash = [img_path for img_path in trash if img_path in existing]
     
     if len(valid_trash) != len(trash):
         save_trash(valid_trash)
+    _mark_cleaned(TRASH_FILE)
     
     return valid_trash
 
 
 def load_seen() -> Dict[str, Any]:
-    """Load seen data from seen.json.
+    """Load all seen data from the global seen database.
     
     Returns:
         Dict with 'seen' (dict of path -> metadata) and 'total_scrolls' (int)
     """
-    if os.path.exists(SEEN_FILE):
-        try:
-            with open(SEEN_FILE, 'r') as f:
-                data = json.load(f)
-                return {
-                    'seen': data.get('seen', {}),
-                    'total_scrolls': data.get('total_scrolls', 0),
-                }
-        except (json.JSONDecodeError, IOError):
-            return {'seen': {}, 'total_scrolls': 0}
-    return {'seen': {}, 'total_scrolls': 0}
+    return seen_db.load_seen_data(SEEN_DB_FILE)
 
 
 def save_seen(data: Dict[str, Any]) -> None:
-    """Save seen data to seen.json.
+    """Replace the global seen database with data.
     
     Args:
         data: Dict with 'seen' dict and 'total_scrolls' int
     """
-    lock = FileLock(SEEN_FILE + '.lock')
-    with lock:
-        with open(SEEN_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+    seen_db.replace_seen_data(SEEN_DB_FILE, data)
 
 
-def mark_seen_batch(paths: List[str]) -> Dict[str, Any]:
+def mark_seen_batch(paths: List[str]) -> Dict[str, int]:
     """Mark a batch of image paths as seen, incrementing total_scrolls.
     
     Each path records first_seen, seen_count, and last_seen timestamps.
@@ -311,29 +439,10 @@ def mark_seen_batch(paths: List[str]) -> Dict[str, Any]:
         paths: List of absolute file paths to mark as seen
         
     Returns:
-        Updated seen data dict
+        Dict with updated 'total_scrolls' and 'seen_count'
     """
-    data = load_seen()
-    seen_map = data['seen']
-    now = time.time()
-    new_count = 0
-
-    for path in paths:
-        if path in seen_map:
-            seen_map[path]['seen_count'] += 1
-            seen_map[path]['last_seen'] = now
-        else:
-            seen_map[path] = {
-                'first_seen': now,
-                'seen_count': 1,
-                'last_seen': now,
-            }
-            new_count += 1
-
-    data['seen'] = seen_map
-    data['total_scrolls'] = data.get('total_scrolls', 0) + new_count
-    save_seen(data)
-    return data
+    total_scrolls, seen_count = seen_db.mark_seen(SEEN_DB_FILE, paths, time.time())
+    return {'total_scrolls': total_scrolls, 'seen_count': seen_count}
 
 
 def get_seen_stats(total_image_count: int) -> Dict[str, Any]:
@@ -345,9 +454,12 @@ def get_seen_stats(total_image_count: int) -> Dict[str, Any]:
     Returns:
         Dict with seen_count, total_count, total_scrolls, percent_seen
     """
-    data = load_seen()
-    seen_count = len(data['seen'])
-    total_scrolls = data.get('total_scrolls', 0)
+    return _seen_stats(SEEN_DB_FILE, total_image_count)
+
+
+def _seen_stats(db_path: str, total_image_count: int) -> Dict[str, Any]:
+    """Build the seen stats dict for one seen database."""
+    seen_count, total_scrolls = seen_db.get_seen_counts(db_path)
     percent_seen = round((seen_count / total_image_count * 100), 1) if total_image_count > 0 else 0
     return {
         'seen_count': seen_count,
@@ -358,7 +470,7 @@ def get_seen_stats(total_image_count: int) -> Dict[str, Any]:
 
 
 def reset_seen() -> None:
-    """Reset all seen history (clears seen.json)."""
+    """Reset all seen history (clears the global seen database)."""
     save_seen({'seen': {}, 'total_scrolls': 0})
 
 
@@ -368,57 +480,122 @@ def reset_seen() -> None:
 # are in use, and fall back to the global files otherwise.
 # ---------------------------------------------------------------------------
 
-def _active_favorites_file() -> str:
-    """Return the favorites file path for the active profile (or global)."""
-    from app.services.profiles import get_current_profile_id, is_profiles_active, get_profile_data_file
+def _request_cache() -> Optional[Dict[Any, Any]]:
+    """Return this request's memo dict on flask.g (None outside a request)."""
+    try:
+        return g._homefeed_data_cache
+    except AttributeError:
+        cache = g._homefeed_data_cache = {}
+        return cache
+    except RuntimeError:
+        return None
+
+
+def _active_data_file(filename: str, global_file: str) -> str:
+    """Return the data file path for the active profile (or global).
+
+    Cached per request: resolving it takes a session read, the profiles
+    check and a makedirs() of the profile directory.
+    """
+    cache = _request_cache()
+    key = ('path', filename)
+    if cache is not None and key in cache:
+        return cache[key]
+
     profile_id = get_current_profile_id()
     if profile_id and is_profiles_active():
-        return get_profile_data_file(profile_id, 'favorites.json')
-    return FAVORITES_FILE
+        result = get_profile_data_file(profile_id, filename)
+    else:
+        result = global_file
+
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+def _active_favorites_file() -> str:
+    """Return the favorites file path for the active profile (or global)."""
+    return _active_data_file('favorites.json', FAVORITES_FILE)
 
 
 def _active_trash_file() -> str:
     """Return the trash file path for the active profile (or global)."""
-    from app.services.profiles import get_current_profile_id, is_profiles_active, get_profile_data_file
-    profile_id = get_current_profile_id()
-    if profile_id and is_profiles_active():
-        return get_profile_data_file(profile_id, 'trash.json')
-    return TRASH_FILE
+    return _active_data_file('trash.json', TRASH_FILE)
 
 
-def _active_seen_file() -> str:
-    """Return the seen file path for the active profile (or global)."""
-    from app.services.profiles import get_current_profile_id, is_profiles_active, get_profile_data_file
-    profile_id = get_current_profile_id()
-    if profile_id and is_profiles_active():
-        return get_profile_data_file(profile_id, 'seen.json')
-    return SEEN_FILE
+def _active_seen_db() -> str:
+    """Return the seen database path for the active profile (or global)."""
+    return _active_data_file('seen.db', SEEN_DB_FILE)
+
+
+# Parsed JSON files keyed by path -> (mtime_ns, size, ino, data).  A file is
+# only re-parsed when its stat changes, so the favorites/trash files (global
+# and per-profile) cost one stat() per request instead of a full parse.
+# Saves replace the file, giving it a new inode, so a same-size rewrite is
+# noticed even where mtime is too coarse (FAT/exFAT, HFS+) to change.
+_json_file_cache: Dict[str, Tuple[int, int, int, Any]] = {}
 
 
 def _load_json_file(filepath: str, default: Any) -> Any:
-    """Load JSON from a file, returning default if missing or corrupt."""
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-    return default
+    """Load JSON from a file, returning default if missing or corrupt.
+
+    The parsed data is cached and shared between callers — copy it before
+    modifying.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return default
+    cached = _json_file_cache.get(filepath)
+    if (cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size
+            and cached[2] == st.st_ino):
+        return cached[3]
+    try:
+        data = json_load_file(filepath)
+    except (ValueError, IOError):
+        return default
+    _json_file_cache[filepath] = (st.st_mtime_ns, st.st_size, st.st_ino, data)
+    return data
+
+
+def _load_active_json_file(filepath: str, default: Any) -> Any:
+    """_load_json_file() memoized on flask.g for the rest of the request.
+
+    _save_json_file() drops the entry so a save is always followed by a
+    fresh (cached) read.
+    """
+    cache = _request_cache()
+    if cache is None:
+        return _load_json_file(filepath, default)
+    if filepath not in cache:
+        cache[filepath] = _load_json_file(filepath, default)
+    return cache[filepath]
 
 
 def _save_json_file(filepath: str, data: Any) -> None:
-    """Save JSON to a file with a file lock."""
+    """Save JSON to a file with a file lock.
+
+    The file is replaced atomically (json_utils.write_file), so readers,
+    which don't take the lock, never see a half-written file.  Written
+    compact: these files are only read by the app.  data becomes the cached
+    copy of the file, so it must not be modified after saving.
+    """
     lock = FileLock(filepath + '.lock')
     with lock:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        json_write_file(filepath, data)
+        # Stat while still holding the lock so no other writer can slip in
+        st = os.stat(filepath)
+    _json_file_cache[filepath] = (st.st_mtime_ns, st.st_size, st.st_ino, data)
+    cache = _request_cache()
+    if cache is not None:
+        cache.pop(filepath, None)
 
 
 def load_active_favorites() -> List[str]:
     """Load favorites for the current profile (or global)."""
     filepath = _active_favorites_file()
-    data = _load_json_file(filepath, {'favorites': []})
-    return data.get('favorites', [])
+    data = _load_active_json_file(filepath, {'favorites': []})
+    return list(data.get('favorites', []))
 
 
 def save_active_favorites(favorites: List[str]) -> None:
@@ -429,17 +606,22 @@ def save_active_favorites(favorites: List[str]) -> None:
 def cleanup_active_favorites() -> List[str]:
     """Remove active-profile favorites that no longer exist on disk."""
     favorites = load_active_favorites()
-    valid = [p for p in favorites if os.path.exists(p)]
+    filepath = _active_favorites_file()
+    if _cleanup_is_fresh(filepath):
+        return favorites
+    existing = _existing_paths(favorites)
+    valid = [p for p in favorites if p in existing]
     if len(valid) != len(favorites):
         save_active_favorites(valid)
+    _mark_cleaned(filepath)
     return valid
 
 
 def load_active_trash() -> List[str]:
     """Load trash for the current profile (or global)."""
     filepath = _active_trash_file()
-    data = _load_json_file(filepath, {'trash': []})
-    return data.get('trash', [])
+    data = _load_active_json_file(filepath, {'trash': []})
+    return list(data.get('trash', []))
 
 
 def save_active_trash(trash: List[str]) -> None:
@@ -450,60 +632,49 @@ def save_active_trash(trash: List[str]) -> None:
 def cleanup_active_trash() -> List[str]:
     """Remove active-profile trash entries that no longer exist on disk."""
     trash = load_active_trash()
-    valid = [p for p in trash if os.path.exists(p)]
+    filepath = _active_trash_file()
+    if _cleanup_is_fresh(filepath):
+        return trash
+    existing = _existing_paths(trash)
+    valid = [p for p in trash if p in existing]
     if len(valid) != len(trash):
         save_active_trash(valid)
+    _mark_cleaned(filepath)
     return valid
 
 
 def load_active_seen() -> Dict[str, Any]:
     """Load seen data for the current profile (or global)."""
-    filepath = _active_seen_file()
-    data = _load_json_file(filepath, {'seen': {}, 'total_scrolls': 0})
-    return {
-        'seen': data.get('seen', {}),
-        'total_scrolls': data.get('total_scrolls', 0),
-    }
+    return seen_db.load_seen_data(_active_seen_db())
+
+
+def load_active_seen_keys() -> FrozenSet[str]:
+    """Return the seen paths for the current profile (or global), read-only.
+
+    The set is cached in seen_db until the next write to the database, so
+    the unseen feed doesn't rebuild a 200k-entry container per request.
+    """
+    return seen_db.get_seen_paths(_active_seen_db())
 
 
 def save_active_seen(data: Dict[str, Any]) -> None:
     """Save seen data for the current profile (or global)."""
-    _save_json_file(_active_seen_file(), data)
+    seen_db.replace_seen_data(_active_seen_db(), data)
 
 
-def mark_active_seen_batch(paths: List[str]) -> Dict[str, Any]:
-    """Mark a batch of paths as seen for the current profile (or global)."""
-    data = load_active_seen()
-    seen_map = data['seen']
-    now = time.time()
-    new_count = 0
+def mark_active_seen_batch(paths: List[str]) -> Dict[str, int]:
+    """Mark a batch of paths as seen for the current profile (or global).
 
-    for path in paths:
-        if path in seen_map:
-            seen_map[path]['seen_count'] += 1
-            seen_map[path]['last_seen'] = now
-        else:
-            seen_map[path] = {'first_seen': now, 'seen_count': 1, 'last_seen': now}
-            new_count += 1
-
-    data['seen'] = seen_map
-    data['total_scrolls'] = data.get('total_scrolls', 0) + new_count
-    save_active_seen(data)
-    return data
+    Returns:
+        Dict with updated 'total_scrolls' and 'seen_count'.
+    """
+    total_scrolls, seen_count = seen_db.mark_seen(_active_seen_db(), paths, time.time())
+    return {'total_scrolls': total_scrolls, 'seen_count': seen_count}
 
 
 def get_active_seen_stats(total_image_count: int) -> Dict[str, Any]:
     """Get seen stats for the current profile (or global)."""
-    data = load_active_seen()
-    seen_count = len(data['seen'])
-    total_scrolls = data.get('total_scrolls', 0)
-    percent_seen = round((seen_count / total_image_count * 100), 1) if total_image_count > 0 else 0
-    return {
-        'seen_count': seen_count,
-        'total_count': total_image_count,
-        'total_scrolls': total_scrolls,
-        'percent_seen': percent_seen,
-    }
+    return _seen_stats(_active_seen_db(), total_image_count)
 
 
 def reset_active_seen() -> None:
@@ -515,12 +686,12 @@ def reset_active_seen() -> None:
 # Comments
 # Comments are global (not per-profile) — they annotate the files themselves.
 # When profiles are active, comments optionally record the profile name so
-# multiple users can be identified. Structure:
+# multiple users can be identified.
 #
-# comments.json = {
-#   "/abs/path/to/photo.jpg": [
-#     {
-#       "id": "uuid-string",
+# Storage is an append-only log, comments.jsonl, with one record per line:
+#
+#   {"op": "add", "path": "/abs/path/to/photo.jpg", "comment": {
+#       "id": "hex-string",
 #       "text": "comment body",
 #       "type": "user",          # "user" | "reddit"
 #       "profile_id": null,      # profile id when profiles are on
@@ -528,37 +699,152 @@ def reset_active_seen() -> None:
 #       "author": null,          # for reddit type: reddit username
 #       "score": null,           # for reddit type: upvote count
 #       "created_at": 1234567890.0,
-#       "edited_at": null
-#     }
-#   ]
-# }
+#       "edited_at": null}}
+#   {"op": "edit", "path": "...", "id": "...", "text": "...", "edited_at": 1234567890.0}
+#   {"op": "delete", "path": "...", "id": "..."}
+#
+# Every mutation appends one line instead of re-serializing all comments.
+# Each process keeps the replayed log in memory and only reads the bytes
+# appended since it last looked, so writes from other workers are picked up
+# too.  save_comments() and cleanup_orphaned_comments() compact the log
+# (one "add" per live comment) via an atomic rename, which readers detect as
+# an inode change.  A legacy comments.json is converted by
+# migrate_legacy_comments() at startup.
 # ---------------------------------------------------------------------------
 
+_comments_lock = threading.Lock()
+# Replayed log: path -> comments, plus how far (offset) into which file (ino)
+# it has been read, the file size seen at that point and the record count.
+_comments_state: Dict[str, Any] = {'data': {}, 'offset': 0, 'size': 0, 'ino': None, 'records': 0}
+
+
+def _apply_comment_record(data: Dict[str, List[Dict[str, Any]]], record: Dict[str, Any]) -> None:
+    """Apply one log record to the replayed comments dict."""
+    op = record.get('op')
+    path = record.get('path')
+    if op == 'add':
+        data.setdefault(path, []).append(record['comment'])
+    elif op == 'edit':
+        for comment in data.get(path, ()):
+            if comment.get('id') == record['id']:
+                comment['text'] = record['text']
+                comment['edited_at'] = record['edited_at']
+                break
+    elif op == 'delete':
+        comments = [c for c in data.get(path, ()) if c.get('id') != record['id']]
+        if comments:
+            data[path] = comments
+        else:
+            data.pop(path, None)
+
+
+def _refresh_comments() -> Dict[str, List[Dict[str, Any]]]:
+    """Replay any new log records and return the in-memory comments.
+
+    Callers must hold _comments_lock and must not modify the result.
+    """
+    state = _comments_state
+    try:
+        st = os.stat(COMMENTS_LOG_FILE)
+    except FileNotFoundError:
+        state.update(data={}, offset=0, size=0, ino=None, records=0)
+        return state['data']
+
+    # Compacted (replaced) or truncated — start over from the beginning
+    if st.st_ino != state['ino'] or st.st_size < state['offset']:
+        state.update(data={}, offset=0, size=0, ino=st.st_ino, records=0)
+
+    if st.st_size > state['offset']:
+        with open(COMMENTS_LOG_FILE, 'rb') as f:
+            f.seek(state['offset'])
+            chunk = f.read()
+        # Only consume complete lines; a trailing partial line is either still
+        # being written or was torn by a crash (truncated by the next writer).
+        end = chunk.rfind(b'\n') + 1
+        data = state['data']
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json_loads(line)
+            except ValueError:
+                continue
+            _apply_comment_record(data, record)
+            state['records'] += 1
+        state['offset'] += end
+    state['size'] = st.st_size
+    return state['data']
+
+
+def _append_comment_record(record: Dict[str, Any]) -> None:
+    """Append one record to the log and apply it to the in-memory state.
+
+    Callers must hold _comments_lock and the log's FileLock, and must have
+    called _refresh_comments() under them.
+    """
+    state = _comments_state
+    with open(COMMENTS_LOG_FILE, 'ab') as f:
+        if state['size'] > state['offset']:
+            f.truncate(state['offset'])  # drop a torn line left by a crashed writer
+        f.write(json_dumps(record) + b'\n')
+        state['offset'] = state['size'] = f.tell()
+        state['ino'] = os.fstat(f.fileno()).st_ino
+    _apply_comment_record(state['data'], record)
+    state['records'] += 1
+
+
+def _write_comments_log(data: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Atomically replace the log with one "add" record per comment.
+
+    Callers must hold the log's FileLock.
+    """
+    tmp_path = COMMENTS_LOG_FILE + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for path, comments in data.items():
+            for comment in comments:
+                f.write(json_dumps({'op': 'add', 'path': path, 'comment': comment}) + b'\n')
+    os.replace(tmp_path, COMMENTS_LOG_FILE)
+
+
+def migrate_legacy_comments() -> None:
+    """Convert a legacy comments.json into the comments log (once)."""
+    if os.path.exists(COMMENTS_LOG_FILE) or not os.path.exists(COMMENTS_FILE):
+        return
+    lock = FileLock(COMMENTS_LOG_FILE + '.lock')
+    with lock:
+        if not os.path.exists(COMMENTS_LOG_FILE):
+            _write_comments_log(_load_json_file(COMMENTS_FILE, {}))
+
+
 def load_comments() -> Dict[str, List[Dict[str, Any]]]:
-    """Load all comments from comments.json.
+    """Load all comments.
 
     Returns:
         Dict mapping absolute image paths to lists of comment dicts.
     """
-    return _load_json_file(COMMENTS_FILE, {})
+    with _comments_lock:
+        data = _refresh_comments()
+        return {path: [dict(c) for c in comments] for path, comments in data.items()}
 
 
 def save_comments(data: Dict[str, List[Dict[str, Any]]]) -> None:
-    """Save all comments to comments.json."""
-    _save_json_file(COMMENTS_FILE, data)
+    """Replace all comments (rewrites the log in compacted form)."""
+    with _comments_lock, FileLock(COMMENTS_LOG_FILE + '.lock'):
+        _write_comments_log(data)
 
 
 def get_comments_for_path(image_path: str) -> List[Dict[str, Any]]:
     """Get all stored user/reddit comments for a specific image path."""
-    data = load_comments()
-    return data.get(image_path, [])
+    with _comments_lock:
+        data = _refresh_comments()
+        return [dict(c) for c in data.get(image_path, ())]
 
 
 def add_comment(image_path: str, comment: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Add a comment to an image and persist it.
 
-    The entire read-modify-write cycle is protected by FileLock to prevent
-    concurrent requests from clobbering each other's data.
+    Appends a single record to the log while holding the log's FileLock, so
+    concurrent writers never interleave partial lines.
 
     Args:
         image_path: Absolute path to the image file.
@@ -567,15 +853,10 @@ def add_comment(image_path: str, comment: Dict[str, Any]) -> List[Dict[str, Any]
     Returns:
         Updated list of comments for this image.
     """
-    lock = FileLock(COMMENTS_FILE + '.lock')
-    with lock:
-        data = _load_json_file(COMMENTS_FILE, {})
-        if image_path not in data:
-            data[image_path] = []
-        data[image_path].append(comment)
-        with open(COMMENTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        return data[image_path]
+    with _comments_lock, FileLock(COMMENTS_LOG_FILE + '.lock'):
+        _refresh_comments()
+        _append_comment_record({'op': 'add', 'path': image_path, 'comment': dict(comment)})
+        return [dict(c) for c in _comments_state['data'][image_path]]
 
 
 def update_comment(image_path: str, comment_id: str, new_text: str) -> Optional[Dict[str, Any]]:
@@ -583,23 +864,24 @@ def update_comment(image_path: str, comment_id: str, new_text: str) -> Optional[
 
     Args:
         image_path: Absolute path to the image file.
-        comment_id: UUID of the comment to update.
+        comment_id: ID of the comment to update.
         new_text: New comment text.
 
     Returns:
         Updated comment dict, or None if not found.
     """
-    lock = FileLock(COMMENTS_FILE + '.lock')
-    with lock:
-        data = _load_json_file(COMMENTS_FILE, {})
-        comments = data.get(image_path, [])
-        for comment in comments:
+    with _comments_lock, FileLock(COMMENTS_LOG_FILE + '.lock'):
+        data = _refresh_comments()
+        for comment in data.get(image_path, ()):
             if comment.get('id') == comment_id and comment.get('type') == 'user':
-                comment['text'] = new_text
-                comment['edited_at'] = time.time()
-                with open(COMMENTS_FILE, 'w') as f:
-                    json.dump(data, f, indent=2)
-                return comment
+                _append_comment_record({
+                    'op': 'edit',
+                    'path': image_path,
+                    'id': comment_id,
+                    'text': new_text,
+                    'edited_at': time.time(),
+                })
+                return dict(comment)
     return None
 
 
@@ -608,42 +890,37 @@ def delete_comment(image_path: str, comment_id: str) -> bool:
 
     Args:
         image_path: Absolute path to the image file.
-        comment_id: UUID of the comment to delete.
+        comment_id: ID of the comment to delete.
 
     Returns:
         True if deleted, False if not found.
     """
-    lock = FileLock(COMMENTS_FILE + '.lock')
-    with lock:
-        data = _load_json_file(COMMENTS_FILE, {})
-        comments = data.get(image_path, [])
-        new_comments = [c for c in comments if c.get('id') != comment_id]
-        if len(new_comments) == len(comments):
+    with _comments_lock, FileLock(COMMENTS_LOG_FILE + '.lock'):
+        data = _refresh_comments()
+        if not any(c.get('id') == comment_id for c in data.get(image_path, ())):
             return False
-        data[image_path] = new_comments
-        if not data[image_path]:
-            del data[image_path]
-        with open(COMMENTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _append_comment_record({'op': 'delete', 'path': image_path, 'id': comment_id})
         return True
 
 
 def cleanup_orphaned_comments() -> int:
     """Remove comments for image files that no longer exist on disk.
 
-    Called at startup and after library scans to prevent unbounded growth
-    of comments.json.
+    Also compacts the log when it holds edit/delete records or superseded
+    entries, so it does not grow without bound.
 
     Returns:
         Number of image entries removed.
     """
-    lock = FileLock(COMMENTS_FILE + '.lock')
-    with lock:
-        data = _load_json_file(COMMENTS_FILE, {})
+    if _cleanup_is_fresh(COMMENTS_LOG_FILE):
+        return 0
+    with _comments_lock, FileLock(COMMENTS_LOG_FILE + '.lock'):
+        data = _refresh_comments()
         before = len(data)
-        data = {path: comments for path, comments in data.items() if os.path.exists(path)}
-        after = len(data)
-        if before != after:
-            with open(COMMENTS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-    return before - after
+        existing = _existing_paths(data)
+        live = {path: comments for path, comments in data.items() if path in existing}
+        live_count = sum(len(comments) for comments in live.values())
+        if len(live) != before or _comments_state['records'] != live_count:
+            _write_comments_log(live)
+        _mark_cleaned(COMMENTS_LOG_FILE)
+    return before - len(live)
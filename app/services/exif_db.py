@@ -0,0 +1,97 @@
+"""
+SQLite storage for the persistent EXIF date cache.
+
+    exif(path TEXT, mtime INTEGER, size INTEGER, ts REAL,
+         PRIMARY KEY (path, mtime, size))
+
+ts is the EXIF timestamp, or NULL when the file was checked and has no EXIF
+date.  Each scan adds only its new results in one transaction instead of
+rewriting a JSON file that grows with the library, and WAL mode lets every
+worker read and write the same file.  A legacy .exif_date_cache.json next to
+the database is imported the first time the database is opened.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.services import sqlite_utils
+from app.services.json_utils import load_file as json_load_file
+
+
+# Cache key: (path, int(mtime), size)
+ExifKey = Tuple[str, int, int]
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS exif (
+    path TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ts REAL,
+    PRIMARY KEY (path, mtime, size)
+) WITHOUT ROWID;
+'''
+
+# PRAGMA user_version once the legacy JSON cache has been imported
+_MIGRATED_VERSION = 1
+
+
+def _connect(db_path: str) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Return the shared connection (and its lock) for db_path, opening it once."""
+    return sqlite_utils.connect(db_path, _init_db)
+
+
+def _init_db(conn: sqlite3.Connection, db_path: str) -> None:
+    """Create the schema and import a legacy JSON cache (new connections only)."""
+    conn.executescript(_SCHEMA)
+    _migrate_legacy_json(conn, os.path.splitext(db_path)[0] + '.json')
+
+
+def _migrate_legacy_json(conn: sqlite3.Connection, json_path: str) -> None:
+    """Import a legacy "path:mtime:size" -> ts JSON cache (once)."""
+    if conn.execute('PRAGMA user_version').fetchone()[0] >= _MIGRATED_VERSION:
+        return
+    with sqlite_utils.write_transaction(conn):
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= _MIGRATED_VERSION:
+            return  # Another worker got here first
+        try:
+            data = json_load_file(json_path)
+        except (ValueError, OSError):
+            data = {}
+        conn.executemany(
+            'INSERT OR IGNORE INTO exif VALUES (?, ?, ?, ?)',
+            _legacy_rows(data if isinstance(data, dict) else {}),
+        )
+        conn.execute(f'PRAGMA user_version = {_MIGRATED_VERSION}')
+
+
+def _legacy_rows(data: Dict[str, Optional[float]]) -> Iterable[Tuple[str, int, int, Optional[float]]]:
+    """Yield (path, mtime, size, ts) rows from legacy "path:mtime:size" keys."""
+    for key, ts in data.items():
+        path, _, rest = key.rpartition(':')
+        path, _, mtime = path.rpartition(':')
+        try:
+            yield path, int(mtime), int(rest), ts
+        except ValueError:
+            continue  # Malformed key — the file is simply re-read next scan
+
+
+def load_dates(db_path: str) -> Dict[ExifKey, Optional[float]]:
+    """Return every cached EXIF date keyed by (path, mtime, size)."""
+    conn, lock = _connect(db_path)
+    with lock:
+        rows = conn.execute('SELECT path, mtime, size, ts FROM exif').fetchall()
+    return {(path, mtime, size): ts for path, mtime, size, ts in rows}
+
+
+def store_dates(db_path: str, dates: Dict[ExifKey, Optional[float]]) -> None:
+    """Insert (or replace) dates in a single transaction."""
+    if not dates:
+        return
+    conn, lock = _connect(db_path)
+    with lock, sqlite_utils.write_transaction(conn):
+        conn.executemany(
+            'INSERT OR REPLACE INTO exif VALUES (?, ?, ?, ?)',
+            ((path, mtime, size, ts) for (path, mtime, size), ts in dates.items()),
+        )
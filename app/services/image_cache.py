@@ -4,12 +4,23 @@ Provides cached access to the list of images from configured folders.
 """
 
 import os
-import json
+import stat
+import struct
+import threading
 import time
 import logging
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # Pillow is optional (EXIF dates of non-JPEG/TIFF files)
+    PILImage = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,70 +30,398 @@ from app.config import (
     SUPPORTED_FORMATS,
     VIDEO_FORMATS,
     MAX_VIDEO_SIZE,
-    EXIF_DATE_CACHE_FILE,
+    EXIF_DATE_CACHE_DB,
+    IMAGE_LIST_CACHE_FILE,
+)
+from app.services import exif_db
+from app.services.json_utils import load_file as json_load_file, write_file as json_write_file
+from app.services.data import get_optimization_settings
+from app.services.profiles import get_current_folders
+from app.services.path_utils import (
+    normalize_path,
+    quote_path,
+    get_image_url_prefix,
 )
-from app.services.path_utils import expand_path, normalize_path
-
 
-# Image list cache (with TTL)
-_image_cache: Dict[str, Any] = {
-    'images': None,
-    'timestamp': 0,
-    'folder_mtimes': {},   # Track folder modification times
-    'date_source': None,   # Track which date_source was used, to detect setting changes
-    'folder_index': {},    # Dict[folder_path, List[image_path]] for O(1) folder lookups
-}
 
-# Leaf folders cache (computed from image list)
-_leaf_folders_cache: List[Dict[str, Any]] = []
+def _new_image_cache() -> Dict[str, Any]:
+    """Return an empty image list cache snapshot."""
+    return {
+        'images': None,
+        'timestamp': 0,
+        'scanned_at': 0,       # time.monotonic() of the walk that built it ('timestamp' may be extended)
+        'folders': [],         # Configured folder list the scan was built for
+        'folder_mtimes': {},   # Track folder modification times
+        'date_source': None,   # Track which date_source was used, to detect setting changes
+        'exif_dates': True,    # Whether EXIF dates were used (the exif_dates setting)
+        'folder_index': {},    # Dict[folder_path, List[image_path]] for O(1) folder lookups
+        'folder_newest': {},   # Dict[folder_path, newest effective date] (same keys/order)
+        'date_array': array('d'),  # Effective date of each image, parallel to 'images'
+        'image_urls': {},      # Dict[url_prefix, List[url]] parallel to 'images', built lazily
+        'leaf_folders': None,  # get_leaf_folders() result, built lazily
+        'last_validated': 0,   # time.monotonic() of the last folder mtime check
+    }
+
+
+# Image list cache (with TTL).  Each scan builds a new snapshot dict and
+# swaps it in with a single assignment, so readers that take one reference
+# (_get_image_snapshot()) always see a consistent image list, folder index
+# and URL list, even while a rescan is running in another thread.
+_image_cache: Dict[str, Any] = _new_image_cache()
+
+# Only one scan runs at a time in a process (request threads or prewarmer)
+_scan_lock = threading.Lock()
+
+# Folder mtimes are re-checked at most this often on cache hits (seconds)
+_FOLDER_REVALIDATE_SECONDS = 2.0
+# Configured folders needed before the mtime check uses a thread pool
+_PARALLEL_MTIME_MIN_FOLDERS = 4
+_MTIME_WORKERS = 16
 
 # ---------------------------------------------------------------------------
 # Persistent EXIF date cache
 #
-# Maps "path:mtime:size" -> EXIF timestamp (float) or None (no EXIF found).
-# Survives server restarts, so Pillow is only called for new or changed files.
-# Each gunicorn worker maintains its own in-memory copy and independently
-# reads/writes the shared cache file; since the cache is purely additive, any
-# write race only results in a few redundant PIL calls on the next scan — never
-# incorrect data.
+# Maps (path, int(mtime), size) -> EXIF timestamp (float) or None (no EXIF
+# found), stored in an SQLite database (see exif_db) so Pillow is only called
+# for new or changed files, even after a restart.  Each worker loads the
+# table into memory on its first scan; results found during a scan are kept
+# in _exif_date_cache_pending and written in one transaction when the scan
+# ends.  The cache is purely additive, so entries another worker adds later
+# only cost this worker a few redundant PIL calls — never incorrect data.
+#
+# In memory, only dates are kept as (path, mtime, size) -> float entries.
+# Files known to have no EXIF date are kept as just hash(key) in
+# _exif_no_date, an int per file instead of a key tuple, path string and
+# dict slot.  Unlike a Bloom filter this can't misreport a dated file as
+# undated short of a full 64-bit hash collision.
 # ---------------------------------------------------------------------------
-_exif_date_cache: Dict[str, Optional[float]] = {}
-_exif_date_cache_dirty: bool = False
+_exif_date_cache: Optional[Dict[exif_db.ExifKey, float]] = None
+_exif_no_date: Set[int] = set()
+_exif_date_cache_pending: Dict[exif_db.ExifKey, Optional[float]] = {}
 
+# Cache misses in one scan needed before EXIF reads go to a thread pool
+_PARALLEL_EXIF_MIN_FILES = 16
+_EXIF_WORKERS = 8
 
-def _load_exif_date_cache() -> None:
-    """Load the persistent EXIF date cache from disk."""
+
+def _load_exif_date_cache() -> Dict[exif_db.ExifKey, float]:
+    """Return the in-memory EXIF date cache, loading it on first use.
+
+    Entries without a date go to _exif_no_date instead of the returned dict.
+    """
     global _exif_date_cache
-    try:
-        if os.path.exists(EXIF_DATE_CACHE_FILE):
-            with open(EXIF_DATE_CACHE_FILE, 'r') as f:
-                _exif_date_cache = json.load(f)
-            logger.debug("Loaded %d EXIF date cache entries from disk", len(_exif_date_cache))
-    except Exception as e:
-        logger.warning("Could not load EXIF date cache (will rebuild): %s", e)
-        _exif_date_cache = {}
+    if _exif_date_cache is None:
+        dates: Dict[exif_db.ExifKey, float] = {}
+        try:
+            for key, exif_ts in exif_db.load_dates(EXIF_DATE_CACHE_DB).items():
+                if exif_ts is None:
+                    _exif_no_date.add(hash(key))
+                else:
+                    dates[key] = exif_ts
+            logger.debug(
+                "Loaded %d EXIF date cache entries from disk (%d without a date)",
+                len(dates) + len(_exif_no_date), len(_exif_no_date),
+            )
+        except Exception as e:
+            logger.warning("Could not load EXIF date cache (will rebuild): %s", e)
+        _exif_date_cache = dates
+    return _exif_date_cache
+
+
+def _is_exif_date_cached(key: exif_db.ExifKey) -> bool:
+    """Return True if the EXIF date (or its absence) of key is cached."""
+    return key in _load_exif_date_cache() or hash(key) in _exif_no_date
+
+
+def _cache_exif_date(key: exif_db.ExifKey, exif_ts: Optional[float]) -> None:
+    """Record a freshly read EXIF date (None: no date) in memory and for saving."""
+    if exif_ts is None:
+        _exif_no_date.add(hash(key))
+    else:
+        _load_exif_date_cache()[key] = exif_ts
+    _exif_date_cache_pending[key] = exif_ts
 
 
 def _save_exif_date_cache() -> None:
-    """Write the EXIF date cache to disk if it has new entries."""
-    global _exif_date_cache_dirty
-    if not _exif_date_cache_dirty:
+    """Write the EXIF dates found since the last save to disk."""
+    global _exif_date_cache_pending
+    if not _exif_date_cache_pending:
         return
+    pending, _exif_date_cache_pending = _exif_date_cache_pending, {}
     try:
-        with open(EXIF_DATE_CACHE_FILE, 'w') as f:
-            json.dump(_exif_date_cache, f)
-        _exif_date_cache_dirty = False
-        logger.debug("Saved EXIF date cache (%d entries)", len(_exif_date_cache))
+        exif_db.store_dates(EXIF_DATE_CACHE_DB, pending)
+        logger.debug("Saved %d new EXIF date cache entries", len(pending))
     except Exception as e:
         logger.warning("Could not save EXIF date cache: %s", e)
 
 
+# EXIF date tags in order of preference: DateTimeOriginal, DateTimeDigitized
+_EXIF_DATE_TAGS = (36867, 36868)
+_EXIF_IFD_POINTER = 0x8769
+_JPEG_SUFFIXES = frozenset({'.jpg', '.jpeg'})
+# TIFF-structured formats (TIFF and most camera raw): the IFDs holding the
+# EXIF dates sit near the start, so only the first _TIFF_HEAD_BYTES are read
+_TIFF_SUFFIXES = frozenset({'.tif', '.tiff', '.dng', '.arw', '.cr2', '.nef', '.rw2'})
+_TIFF_HEAD_BYTES = 64 * 1024
+# Formats that carry an EXIF capture date in practice.  Everything else
+# (PNG, GIF, WebP, videos) goes straight to the filesystem date: no file
+# read and no EXIF cache entry.
+_EXIF_FORMATS = frozenset({
+    '.jpg', '.jpeg', '.heic', '.heif', '.tif', '.tiff', '.dng',
+    '.arw', '.cr2', '.cr3', '.nef', '.raf', '.rw2',
+})
+
+
+@lru_cache(maxsize=4096)
+def _local_hour_start(hour: int) -> float:
+    """Return the Unix timestamp of local time YYYYMMDDHH:00:00 (hour as one number).
+
+    Photos cluster in time, so most EXIF dates hit this cache instead of
+    doing a local time zone conversion each.  Offset changes happen on the
+    hour, so adding minutes and seconds to the hour's start matches
+    converting the full datetime — except for times that don't exist
+    locally in zones with a half-hour DST shift (Lord Howe Island).
+
+    Raises:
+        ValueError: If the date or hour is out of range.
+    """
+    return datetime(hour // 1000000, hour // 10000 % 100, hour // 100 % 100, hour % 100).timestamp()
+
+
+def _parse_exif_datetime(raw: Any) -> Optional[float]:
+    """Convert an EXIF "YYYY:MM:DD HH:MM:SS" value to a Unix timestamp.
+
+    The value is interpreted as local time, like a naive datetime.  Values
+    in exactly that 19-character layout (virtually all of them) are sliced
+    and converted with int(), which is many times faster than strptime;
+    anything else still goes through strptime, which also accepts e.g.
+    unpadded fields.  The local-time conversion is done once per hour
+    (_local_hour_start) and minutes and seconds are added to it.
+    """
+    value = str(raw).strip()
+    try:
+        if (len(value) == 19 and value[4] == value[7] == value[13] == value[16] == ':'
+                and value[10] == ' '):
+            # "YYYYMMDDHHMMSS" as one number (isdigit() rejects the signs and
+            # spaces int() would otherwise accept)
+            digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+            if digits.isdigit():
+                n = int(digits)
+                minute = n // 100 % 100
+                second = n % 100
+                if minute > 59 or second > 59:
+                    return None  # datetime() would reject these too
+                return _local_hour_start(n // 10000) + minute * 60 + second
+        return datetime.strptime(value, '%Y:%m:%d %H:%M:%S').timestamp()
+    except (ValueError, OverflowError):
+        return None
+
+
+def _jpeg_exif_segment(f) -> Optional[bytes]:
+    """Return the TIFF data of a JPEG's Exif APP1 segment, or None if it has none.
+
+    Walks the marker segments from the start of the file, seeking past each
+    one, and stops at the start of the image data.
+
+    Raises:
+        ValueError: If the file isn't a JPEG or its markers can't be followed.
+    """
+    if f.read(2) != b'\xff\xd8':
+        raise ValueError('not a JPEG')
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise ValueError('bad JPEG marker')
+        code = marker[1]
+        while code == 0xFF:  # fill bytes
+            code = f.read(1)[0]
+        if code in (0xD9, 0xDA):  # EOI / start of scan: no EXIF before the image data
+            return None
+        if 0xD0 <= code <= 0xD7 or code == 0x01:  # standalone markers
+            continue
+        length = struct.unpack('>H', f.read(2))[0]
+        if code == 0xE1:
+            data = f.read(length - 2)
+            if data[:6] == b'Exif\x00\x00':
+                return data[6:]
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def _tiff_ifd(tiff: bytes, endian: str, offset: int) -> Dict[int, Tuple[int, int, int]]:
+    """Return tag -> (type, count, offset of the value field) for one IFD."""
+    count = struct.unpack_from(endian + 'H', tiff, offset)[0]
+    entries = {}
+    for pos in range(offset + 2, offset + 2 + 12 * count, 12):
+        tag, typ, n = struct.unpack_from(endian + 'HHI', tiff, pos)
+        entries[tag] = (typ, n, pos + 8)
+    return entries
+
+
+def _tiff_exif_date(tiff: bytes) -> Optional[float]:
+    """Find the EXIF date in TIFF-structured EXIF data (IFD0 + Exif IFD).
+
+    Exif IFD values take precedence over IFD0 ones, as in Pillow's
+    _getexif().  tiff may be just the start of a file: anything pointing
+    past its end raises rather than reading as "no date".
+
+    Raises:
+        ValueError, struct.error: If the data is not TIFF or is cut short.
+    """
+    if tiff[:2] == b'II':
+        endian = '<'
+    elif tiff[:2] == b'MM':
+        endian = '>'
+    else:
+        raise ValueError('bad TIFF byte order')
+    ifd0 = _tiff_ifd(tiff, endian, struct.unpack_from(endian + 'I', tiff, 4)[0])
+    tags = dict(ifd0)
+    if _EXIF_IFD_POINTER in ifd0:
+        exif_offset = struct.unpack_from(endian + 'I', tiff, ifd0[_EXIF_IFD_POINTER][2])[0]
+        tags.update(_tiff_ifd(tiff, endian, exif_offset))
+
+    for tag in _EXIF_DATE_TAGS:
+        if tag not in tags:
+            continue
+        typ, n, pos = tags[tag]
+        if typ != 2 or not n:  # only ASCII values are dates
+            continue
+        if n > 4:
+            pos = struct.unpack_from(endian + 'I', tiff, pos)[0]
+        if pos + n > len(tiff):
+            raise ValueError('EXIF value past the end of the data')
+        raw = tiff[pos:pos + n].split(b'\x00', 1)[0].decode('latin-1')
+        if raw:
+            exif_ts = _parse_exif_datetime(raw)
+            if exif_ts is not None:
+                return exif_ts
+    return None
+
+
+def _read_exif_date(path: str) -> Optional[float]:
+    """Return the EXIF DateTimeOriginal/DateTimeDigitized of path, or None.
+
+    JPEGs and TIFF-based files are read directly, without importing or
+    dispatching through Pillow: for JPEGs only the marker headers and the
+    Exif segment, for TIFF-based files the first _TIFF_HEAD_BYTES.  Other
+    formats (and files the direct readers can't follow, such as TIFFs whose
+    EXIF lies further in) go through Pillow.
+
+    None also covers files without EXIF, unreadable or corrupt files, and
+    Pillow not being installed.
+    """
+    dot = path.rfind('.')
+    suffix = path[dot:].lower()
+    try:
+        if suffix in _JPEG_SUFFIXES:
+            with open(path, 'rb') as f:
+                tiff = _jpeg_exif_segment(f)
+            return _tiff_exif_date(tiff) if tiff is not None else None
+        if suffix in _TIFF_SUFFIXES:
+            with open(path, 'rb') as f:
+                head = f.read(_TIFF_HEAD_BYTES)
+            return _tiff_exif_date(head)
+    except (ValueError, struct.error, IndexError):
+        pass  # Not a plain JPEG/TIFF, or EXIF beyond the head — let Pillow try
+    except OSError:
+        return None
+
+    if PILImage is None:
+        return None  # Pillow not installed — fall through to filesystem dates
+    try:
+        with PILImage.open(path) as img:
+            exif = None
+            try:
+                exif = img._getexif()
+            except (AttributeError, Exception):
+                pass
+
+            if exif:
+                for tag_id in _EXIF_DATE_TAGS:
+                    raw = exif.get(tag_id)
+                    if raw:
+                        exif_ts = _parse_exif_datetime(raw)
+                        if exif_ts is not None:
+                            return exif_ts
+    except Exception:
+        pass  # Corrupt file or unreadable EXIF — fall through
+    return None
+
+
+def _prefetch_exif_dates(keys: List[exif_db.ExifKey]) -> None:
+    """Read the EXIF dates for uncached keys on a thread pool and cache them.
+
+    EXIF reads mostly wait on the disk, and Pillow releases the GIL while
+    reading, so overlapping them keeps more requests in flight than reading
+    one file at a time.  The cache itself is only updated from the calling
+    thread.  Small batches are left to _cached_exif_date(), which reads
+    misses inline.
+    """
+    if len(keys) < _PARALLEL_EXIF_MIN_FILES:
+        return
+    with ThreadPoolExecutor(max_workers=_EXIF_WORKERS) as executor:
+        results = executor.map(_read_exif_date, [key[0] for key in keys])
+        for key, exif_ts in zip(keys, results):
+            _cache_exif_date(key, exif_ts)
+
+
+def _cached_exif_date(path: str, file_mtime: float, file_size: int) -> Optional[float]:
+    """Return the EXIF date of path via the persistent EXIF cache.
+
+    On a miss the file is read (_read_exif_date) and the result — including
+    None for "no EXIF date", so Pillow isn't retried next scan — is cached.
+    """
+    cache_key = (path, int(file_mtime), file_size)
+    exif_ts = _load_exif_date_cache().get(cache_key)
+    if exif_ts is not None or hash(cache_key) in _exif_no_date:
+        return exif_ts
+    exif_ts = _read_exif_date(path)
+    _cache_exif_date(cache_key, exif_ts)
+    return exif_ts
+
+
+# get_effective_date() specialized for the scan loop, one per date_source:
+# the caller has the suffix and all stats, and picks the function once per
+# scan instead of branching on date_source for every file.
+
+def _effective_date_mtime(path: str, suffix: str, mtime: float, size: int, ctime: float) -> float:
+    """get_effective_date(..., date_source='mtime') with pre-fetched stats."""
+    if suffix in _EXIF_FORMATS:
+        exif_ts = _cached_exif_date(path, mtime, size)
+        if exif_ts is not None:
+            return exif_ts
+    return mtime if mtime else ctime
+
+
+def _effective_date_ctime(path: str, suffix: str, mtime: float, size: int, ctime: float) -> float:
+    """get_effective_date(..., date_source='ctime') with pre-fetched stats."""
+    if suffix in _EXIF_FORMATS:
+        exif_ts = _cached_exif_date(path, mtime, size)
+        if exif_ts is not None:
+            return exif_ts
+    return ctime if ctime else mtime
+
+
+# With the exif_dates setting off, scans date files from the stats alone
+
+def _filesystem_date_mtime(path: str, suffix: str, mtime: float, size: int, ctime: float) -> float:
+    """_effective_date_mtime() without the EXIF lookup."""
+    return mtime if mtime else ctime
+
+
+def _filesystem_date_ctime(path: str, suffix: str, mtime: float, size: int, ctime: float) -> float:
+    """_effective_date_ctime() without the EXIF lookup."""
+    return ctime if ctime else mtime
+
+
 def get_effective_date(
     path: str,
     date_source: str,
     file_mtime: Optional[float] = None,
     file_size: Optional[int] = None,
     file_ctime: Optional[float] = None,
+    suffix: Optional[str] = None,
+    exif_dates: bool = True,
 ) -> float:
     """Return the best available date (as a Unix timestamp) for a file.
 
@@ -93,13 +432,14 @@ def get_effective_date(
          - ``'mtime'``: modification time first, then creation time
          - ``'ctime'``: creation time first, then modification time
 
-    EXIF extraction requires Pillow.  If Pillow is not installed, or the file
-    is a video, we silently skip to the filesystem fallback.
+    EXIF is only read for formats in _EXIF_FORMATS (JPEG, HEIC, TIFF and
+    camera raw).  Other formats, and files Pillow can't read (or Pillow not
+    being installed), silently skip to the filesystem fallback.
 
-    When ``file_mtime`` and ``file_size`` are provided (from a prior os.stat()
-    call in the scan loop), this function checks the persistent EXIF date cache
-    before opening the file with Pillow.  On a cache hit the file is never
-    opened at all, making subsequent scans effectively free for unchanged files.
+    Stats not provided by the caller are read with a single os.stat().  The
+    persistent EXIF date cache is checked before the file is opened; on a
+    cache hit the file is never opened at all, making subsequent scans
+    effectively free for unchanged files.
 
     Args:
         path:        Absolute path to the file.
@@ -107,81 +447,42 @@ def get_effective_date(
         file_mtime:  Pre-fetched st_mtime (avoids an extra syscall).
         file_size:   Pre-fetched st_size  (used as part of the cache key).
         file_ctime:  Pre-fetched st_ctime (avoids an extra syscall for the fallback).
+        suffix:      Pre-computed lowercase extension (e.g. ``'.jpg'``).
+        exif_dates:  False skips steps 1 and 2 (the ``exif_dates`` setting).
 
     Returns:
         Unix timestamp (float).  Falls back to 0 if nothing is readable.
     """
-    global _exif_date_cache, _exif_date_cache_dirty
+    # One os.stat() for whatever the caller didn't pre-fetch
+    stat_ok = True
+    if file_mtime is None or file_size is None or file_ctime is None:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            stat_ok = False
+        else:
+            if file_mtime is None:
+                file_mtime = file_stat.st_mtime
+            if file_size is None:
+                file_size = file_stat.st_size
+            if file_ctime is None:
+                file_ctime = file_stat.st_ctime
 
     # --- 1 & 2: try EXIF for image files ---
-    suffix = Path(path).suffix.lower()
-    if suffix not in VIDEO_FORMATS:
-        # Build a cache key when we have the file stats (both mtime and size required)
-        cache_key: Optional[str] = None
-        if file_mtime is not None and file_size is not None:
-            cache_key = f"{path}:{int(file_mtime)}:{file_size}"
-
-        # Check persistent EXIF cache before touching the file with Pillow
-        if cache_key is not None and cache_key in _exif_date_cache:
-            cached_exif = _exif_date_cache[cache_key]
-            if cached_exif is not None:
-                return cached_exif
-            # cached_exif is None  →  we previously confirmed this file has no EXIF date;
-            # skip Pillow and fall straight through to the filesystem fallback.
+    if suffix is None and exif_dates:
+        suffix = Path(path).suffix.lower()
+    if exif_dates and suffix in _EXIF_FORMATS:
+        if stat_ok:
+            # Checks the persistent EXIF cache before touching the file
+            exif_ts = _cached_exif_date(path, file_mtime, file_size)
         else:
-            # Cache miss — open the file and extract EXIF
-            exif_ts: Optional[float] = None
-            try:
-                from PIL import Image
-
-                with Image.open(path) as img:
-                    exif = None
-                    try:
-                        exif = img._getexif()
-                    except (AttributeError, Exception):
-                        pass
-
-                    if exif:
-                        # Prefer DateTimeOriginal (tag 36867) then DateTimeDigitized (36868)
-                        for tag_id in (36867, 36868):
-                            raw = exif.get(tag_id)
-                            if raw:
-                                try:
-                                    dt = datetime.strptime(str(raw).strip(), '%Y:%m:%d %H:%M:%S')
-                                    exif_ts = dt.timestamp()
-                                    break
-                                except (ValueError, OverflowError):
-                                    pass
-            except ImportError:
-                pass  # Pillow not installed — fall through to filesystem dates
-            except Exception:
-                pass  # Corrupt file or unreadable EXIF — fall through
-
-            # Store result in cache (None = "no EXIF date" so we don't retry PIL next scan)
-            if cache_key is not None:
-                _exif_date_cache[cache_key] = exif_ts
-                _exif_date_cache_dirty = True
-
-            if exif_ts is not None:
-                return exif_ts
+            exif_ts = _read_exif_date(path)
+        if exif_ts is not None:
+            return exif_ts
 
     # --- 3: filesystem fallback ---
-    # Use pre-fetched stats when available (avoids extra syscalls)
-    if file_mtime is not None:
-        mtime = file_mtime
-    else:
-        try:
-            mtime = os.path.getmtime(path)
-        except OSError:
-            mtime = 0
-
-    if file_ctime is not None:
-        ctime = file_ctime
-    else:
-        try:
-            ctime = os.path.getctime(path)
-        except OSError:
-            ctime = 0
+    mtime = file_mtime or 0
+    ctime = file_ctime or 0
 
     if date_source == 'ctime':
         return ctime if ctime else mtime
@@ -189,36 +490,95 @@ def get_effective_date(
     return mtime if mtime else ctime
 
 
-def get_folder_mtime(folder_path: str) -> float:
+def _walk_dirs(root: str) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """Yield (dirpath, non-directory entries) for root and every directory below it.
+
+    Equivalent to os.walk(root) — same order, symlinked directories listed
+    but not followed, unreadable directories skipped — but hands out the
+    scandir entries themselves, so the caller gets the name, path and
+    (cached) stat without rebuilding paths or calling os.stat() separately.
+    Each directory is closed before its entries are yielded.
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        yield dirpath, files
+        # Reversed so subdirectories are visited in listing order, like os.walk
+        stack.extend(reversed(subdirs))
+
+
+def get_folder_mtime(folder_path: str, newer_than: Optional[float] = None) -> float:
     """Get the max mtime of folder and its direct subdirectories.
     
     This checks only one level deep (folder + immediate subdirectories),
     which catches changes in nested subfolders without walking the entire tree.
     For a folder with 10,000+ photos, this is significantly faster than
     a full os.walk() which was causing performance issues.
+
+    With ``newer_than``, the search stops at the first mtime above it and
+    returns that one: the folder itself is checked first, so a change of
+    its own entries costs a single stat.
     
     Args:
         folder_path: Path to the folder
+        newer_than: Optional mtime to stop at (used by cache validity checks)
         
     Returns:
-        Most recent modification time as timestamp, or 0 if folder doesn't exist
+        Most recent modification time as timestamp (or the first one newer
+        than ``newer_than``), or 0 if folder doesn't exist
     """
-    if not os.path.isdir(folder_path):
+    try:
+        st = os.stat(folder_path)
+    except OSError:
         return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return 0
+    max_mtime = st.st_mtime
+    if newer_than is not None and max_mtime > newer_than:
+        return max_mtime
     try:
-        max_mtime = os.path.getmtime(folder_path)
-        for entry in os.scandir(folder_path):
-            if entry.is_dir(follow_symlinks=False):
-                try:
-                    max_mtime = max(max_mtime, entry.stat().st_mtime)
-                except OSError:
-                    pass
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if mtime > max_mtime:
+                        max_mtime = mtime
+                        if newer_than is not None and mtime > newer_than:
+                            break
         return max_mtime
     except OSError:
         return 0
 
 
-def _is_cache_valid_with_date_source(date_source: str) -> bool:
+def _get_cache_ttl(settings: Dict[str, Any]) -> float:
+    """Return the image list TTL for the given optimization settings."""
+    return CACHE_TTL_HDD if settings.get('hdd_friendly', False) else CACHE_TTL
+
+
+def _is_cache_valid_with_date_source(
+    snapshot: Dict[str, Any],
+    date_source: str,
+    settings: Dict[str, Any],
+    current_folders: List[str],
+) -> bool:
     """Check if the cached image list is still valid for the given date_source setting.
 
     Extends the standard TTL/mtime check with an additional check: if the
@@ -226,156 +586,496 @@ def _is_cache_valid_with_date_source(date_source: str) -> bool:
     is considered stale (because sort order may differ).
 
     Args:
+        snapshot: The image list cache snapshot to check.
         date_source: The currently active date_source setting value.
+        settings: The current optimization settings.
+        current_folders: The active (profile-aware) folder list.
 
     Returns:
         True if cache is valid, False if a rescan is needed.
     """
-    if _image_cache['images'] is None:
+    if snapshot['images'] is None:
         return False
 
-    # If date_source changed, we must re-sort
-    if _image_cache.get('date_source') != date_source:
+    # If date_source (or whether EXIF dates are used) changed, we must re-sort
+    if snapshot.get('date_source') != date_source:
+        return False
+    if snapshot['exif_dates'] != settings.get('exif_dates', True):
         return False
 
     # Check TTL
-    from app.services.data import get_optimization_settings
-    settings = get_optimization_settings()
-    effective_ttl = CACHE_TTL_HDD if settings.get('hdd_friendly', False) else CACHE_TTL
-    if time.time() - _image_cache['timestamp'] > effective_ttl:
+    effective_ttl = _get_cache_ttl(settings)
+    now = time.monotonic()
+    if now - snapshot['timestamp'] > effective_ttl:
         return False
 
-    # Get the current active folders (profile-aware)
-    from app.services.profiles import get_current_folders
-    current_folders = get_current_folders()
-    cached_mtimes = _image_cache.get('folder_mtimes', {})
-
-    if set(current_folders) != set(cached_mtimes.keys()):
+    # Normally the very list the scan used (the cached config's), so this is
+    # a cheap list compare; the set compare only runs when the lists differ
+    cached_mtimes = snapshot.get('folder_mtimes', {})
+    if current_folders != snapshot['folders'] and cached_mtimes.keys() != set(current_folders):
         return False
 
-    # Check if any folder has been modified
-    for folder in current_folders:
-        expanded_path = expand_path(folder)
-        current_mtime = get_folder_mtime(expanded_path)
-        if current_mtime > cached_mtimes.get(folder, 0):
-            return False
+    # Folder mtimes were checked moments ago — skip the per-folder scandir
+    # (a burst of requests from one page load costs one check)
+    if now - snapshot['last_validated'] < _FOLDER_REVALIDATE_SECONDS:
+        return True
 
+    if _folders_modified(current_folders, cached_mtimes):
+        return False
+
+    snapshot['last_validated'] = now
     return True
 
 
-def invalidate_cache() -> None:
-    """Invalidate the image list cache and leaf folders cache."""
-    global _leaf_folders_cache
-    _image_cache['images'] = None
-    _image_cache['timestamp'] = 0
-    _image_cache['folder_mtimes'] = {}
-    _image_cache['effective_dates'] = {}
-    _image_cache['date_source'] = None
-    _image_cache['folder_index'] = {}
-    _leaf_folders_cache = []
+def _folders_modified(folders: List[str], cached_mtimes: Dict[str, float]) -> bool:
+    """Return True if any folder's mtime is newer than the one a scan recorded."""
+    # normalize_path() is memoized, and the same normalized root is what the
+    # scan recorded mtimes for.  Each folder stops scanning at its first
+    # mtime newer than the cached one.
+    expanded_paths = [normalize_path(folder) for folder in folders]
+    previous_mtimes = [cached_mtimes.get(folder, 0) for folder in folders]
+    if len(expanded_paths) < _PARALLEL_MTIME_MIN_FOLDERS:
+        # Lazy: stops at the first changed folder
+        current_mtimes = map(get_folder_mtime, expanded_paths, previous_mtimes)
+    else:
+        # Each folder costs a scandir plus a stat per subdirectory; on slow
+        # or network mounts, overlapping them makes the check take as long as
+        # the slowest folder rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=min(_MTIME_WORKERS, len(expanded_paths))) as executor:
+            current_mtimes = list(executor.map(get_folder_mtime, expanded_paths, previous_mtimes))
+    for previous_mtime, current_mtime in zip(previous_mtimes, current_mtimes):
+        if current_mtime > previous_mtime:
+            return True
+    return False
 
 
-def get_all_images() -> List[str]:
-    """Scan all configured folders and return list of image paths (with caching).
+# ---------------------------------------------------------------------------
+# Persistent image list
+#
+# The result of the last scan is written to IMAGE_LIST_CACHE_FILE, and the
+# first get_all_images() call in a new process loads it instead of starting
+# empty.  The usual validity checks (date_source, folder list, folder mtimes)
+# then decide whether it can be served, so a restart no longer walks every
+# folder when nothing changed.
+# ---------------------------------------------------------------------------
+_IMAGE_LIST_CACHE_VERSION = 1
+_image_list_cache_checked = False
 
-    Images are sorted using a date hierarchy:
-      1. EXIF DateTimeOriginal (shutter time — most accurate)
-      2. EXIF DateTimeDigitized (digitization time)
-      3. Filesystem date determined by the ``date_source`` setting
-         (``'mtime'`` → modification time first; ``'ctime'`` → creation time first)
+
+def _build_folder_index(
+    entries: Iterable[Tuple[str, float, str]],
+) -> Tuple[Dict[str, List[str]], Dict[str, float]]:
+    """Group newest-first (path, effective_date, folder) entries by folder.
 
     Returns:
-        List of image file paths, sorted newest-first by effective date.
+        Tuple of (folder -> image paths, newest-first; folder -> effective
+        date of its newest image), both in order of each folder's newest
+        image.
     """
-    global _leaf_folders_cache
+    folder_index: Dict[str, List[str]] = {}
+    folder_newest: Dict[str, float] = {}
+    for img_path, effective_date, folder in entries:
+        folder_images = folder_index.get(folder)
+        if folder_images is None:
+            folder_index[folder] = [img_path]
+            folder_newest[folder] = effective_date
+        else:
+            folder_images.append(img_path)
+    return folder_index, folder_newest
 
-    # Import here to avoid circular imports
-    from app.services.data import get_optimization_settings
 
-    settings = get_optimization_settings()
-    date_source = settings.get('date_source', 'mtime')
+def _load_image_list_cache() -> None:
+    """Install the scan saved in IMAGE_LIST_CACHE_FILE, if it is usable."""
+    global _image_cache
+    try:
+        data = json_load_file(IMAGE_LIST_CACHE_FILE)
+    except FileNotFoundError:
+        return
+    except (ValueError, OSError) as e:
+        logger.warning("Could not load image list cache (will rescan): %s", e)
+        return
+    if not isinstance(data, dict) or data.get('version') != _IMAGE_LIST_CACHE_VERSION:
+        return
+    images = data['images']
+    dates = array('d', data['dates'])
+    if len(images) != len(dates):
+        return
 
-    # Check cache validity — also bust cache when date_source setting changed
-    if _is_cache_valid_with_date_source(date_source):
-        return _image_cache['images']
+    folder_index, folder_newest = _build_folder_index(
+        zip(images, dates, map(os.path.dirname, images))
+    )
+
+    snapshot = _new_image_cache()
+    snapshot['images'] = images
+    snapshot['date_array'] = dates
+    snapshot['folder_mtimes'] = data['folder_mtimes']
+    snapshot['folders'] = data.get('folders', list(data['folder_mtimes']))
+    snapshot['date_source'] = data['date_source']
+    snapshot['exif_dates'] = data.get('exif_dates', True)
+    snapshot['folder_index'] = folder_index
+    snapshot['folder_newest'] = folder_newest
+    # The TTL starts now; folder mtimes are checked on the first request
+    snapshot['timestamp'] = snapshot['scanned_at'] = time.monotonic()
+    _image_cache = snapshot
+    logger.debug("Loaded %d images from the image list cache", len(images))
+
+
+def _save_image_list_cache(snapshot: Dict[str, Any]) -> None:
+    """Write a scan snapshot to IMAGE_LIST_CACHE_FILE."""
+    try:
+        json_write_file(IMAGE_LIST_CACHE_FILE, {
+            'version': _IMAGE_LIST_CACHE_VERSION,
+            'date_source': snapshot['date_source'],
+            'exif_dates': snapshot['exif_dates'],
+            'folders': snapshot['folders'],
+            'folder_mtimes': snapshot['folder_mtimes'],
+            'images': snapshot['images'],
+            'dates': snapshot['date_array'].tolist(),
+        })
+    except Exception as e:
+        logger.warning("Could not save image list cache: %s", e)
 
-    # Cache is invalid — clear leaf folders cache too so it is rebuilt from the
-    # fresh image list for the current profile.  Without this, a stale
-    # _leaf_folders_cache built for a different profile could be served to users
-    # who happen to match the cached folder_mtimes keys.
-    _leaf_folders_cache = []
 
-    # Get active folders (profile-aware fallback to global config)
-    from app.services.profiles import get_current_folders
-    active_folders = get_current_folders()
+def invalidate_cache() -> None:
+    """Invalidate the image list cache and leaf folders cache."""
+    global _image_cache
+    # The saved scan is stale too (e.g. files deleted below the depth the
+    # folder mtime check looks at)
+    try:
+        os.remove(IMAGE_LIST_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not remove image list cache: %s", e)
+    _image_cache = _new_image_cache()
+    # Drop memoized paths from folders that may no longer be configured
+    normalize_path.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Background prewarmer
+#
+# A daemon thread per process refreshes the cached folder list shortly
+# before the TTL runs out (at _PREWARM_TTL_FRACTION of it), so requests at
+# the TTL boundary find a fresh snapshot instead of paying for the full
+# scan.  It only does so while requests keep coming in, so an idle server is
+# not kept walking the library.  When no folder mtime has changed it just
+# extends the snapshot's TTL; the library is only walked again when a folder
+# changed, or every _PREWARM_FULL_SCAN_TTLS TTLs to catch changes deeper
+# than the one-level folder mtime check sees.
+# ---------------------------------------------------------------------------
+_PREWARM_TTL_FRACTION = 0.8
+_PREWARM_FULL_SCAN_TTLS = 10
+
+# (thread, pid) of this process's prewarmer; a forked worker starts its own
+_prewarm_thread: Optional[Tuple[threading.Thread, int]] = None
+_prewarm_lock = threading.Lock()
+# Set whenever a new snapshot is installed, to reschedule the prewarmer
+_prewarm_wake = threading.Event()
+# time.monotonic() of the last image list request in this process
+_last_request_at = 0.0
+
+
+def _ensure_prewarmer() -> None:
+    """Start this process's prewarmer thread if it isn't running yet."""
+    global _prewarm_thread
+    if _prewarm_thread is not None and _prewarm_thread[1] == os.getpid():
+        return
+    with _prewarm_lock:
+        if _prewarm_thread is not None and _prewarm_thread[1] == os.getpid():
+            return
+        thread = threading.Thread(target=_prewarm_loop, name='homefeed-prewarm', daemon=True)
+        thread.start()
+        _prewarm_thread = (thread, os.getpid())
+
+
+def _prewarm_loop() -> None:
+    """Refresh the cached snapshot before the TTL expires (runs forever)."""
+    while True:
+        _prewarm_wake.clear()
+        snapshot = _image_cache
+        if snapshot['images'] is None:
+            _prewarm_wake.wait()
+            continue
+
+        settings = get_optimization_settings()
+        ttl = _get_cache_ttl(settings)
+        now = time.monotonic()
+        wait = snapshot['timestamp'] + ttl * _PREWARM_TTL_FRACTION - now
+        if wait > 0:
+            _prewarm_wake.wait(wait)
+            continue
+        if (
+            now - _last_request_at > ttl
+            or settings.get('date_source', 'mtime') != snapshot['date_source']
+            or settings.get('exif_dates', True) != snapshot['exif_dates']
+        ):
+            # Idle (or due for a request-side rescan anyway): check back later
+            _prewarm_wake.wait(ttl * (1 - _PREWARM_TTL_FRACTION))
+            continue
+
+        try:
+            with _scan_lock:
+                if _image_cache is not snapshot:
+                    continue  # Replaced while waiting for the lock
+                if (now - snapshot['scanned_at'] < ttl * _PREWARM_FULL_SCAN_TTLS
+                        and not _folders_modified(snapshot['folders'], snapshot['folder_mtimes'])):
+                    # Nothing changed: keep serving this snapshot for another TTL
+                    snapshot['timestamp'] = snapshot['last_validated'] = time.monotonic()
+                else:
+                    _scan_images(snapshot['folders'], snapshot['date_source'], snapshot['exif_dates'])
+        except Exception:
+            logger.exception("Background image list refresh failed")
+            _prewarm_wake.wait(ttl)
+
+
+# ---------------------------------------------------------------------------
+# Scanning
+# ---------------------------------------------------------------------------
+
+# Supported files in one scan needed before they are stat'ed on a thread pool
+_PARALLEL_STAT_MIN_FILES = 512
+_STAT_WORKERS = 16
+
+
+def _stat_entries(files: List[Tuple[os.DirEntry, str]]) -> None:
+    """Call stat() on each entry so the result is cached on the entry."""
+    for entry, _ in files:
+        try:
+            entry.stat()
+        except OSError:
+            pass  # Retried (and skipped) by the scan loop
+
+
+def _prefetch_stats(candidates: List[Tuple[str, List[Tuple[os.DirEntry, str]]]], count: int) -> None:
+    """Stat the candidate files of a scan on a thread pool, one directory per task.
+
+    On POSIX, DirEntry.stat() costs a stat() call per file — the bulk of a
+    scan, and mostly waiting on the disk or a network mount.  Overlapping
+    them keeps the I/O queue full; the results are cached on the entries,
+    so the scan loop's own stat() calls are free.  Small scans, and Windows
+    (where scandir already returns the stat data), stat inline instead.
+    """
+    if count < _PARALLEL_STAT_MIN_FILES or os.name == 'nt':
+        return
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as executor:
+        # Consume the iterator so worker exceptions propagate
+        for _ in executor.map(_stat_entries, map(itemgetter(1), candidates)):
+            pass
+
+
+def _scan_images(active_folders: List[str], date_source: str, exif_dates: bool = True) -> Dict[str, Any]:
+    """Scan active_folders and install the result as the new snapshot.
+
+    Must be called with _scan_lock held.  With exif_dates False, no file is
+    opened: every file is dated from the stats the walk already has.
 
-    # Cache miss or invalid - rescan
-    # Each entry is (path, effective_date) — effective_date is computed once and reused
-    image_entries: List[Tuple[str, float]] = []
+    Returns:
+        The new image list cache snapshot.
+    """
+    global _image_cache
+
+    # Each entry is (path, effective_date, folder) — effective_date is computed
+    # once and reused, folder is the directory the walk found the file in.
+    # Files dated straight from the EXIF cache are filled in during the walk;
+    # the rest hold None until the date pass below.
+    image_entries: List[Optional[Tuple[str, float, str]]] = []
     folder_mtimes: Dict[str, float] = {}
+    # (index into image_entries, path, mtime, size, ctime, suffix, folder)
+    # of every file still needing a date
+    scanned: List[Tuple[int, str, float, int, float, str, str]] = []
+    if exif_dates:
+        exif_formats = _EXIF_FORMATS
+        cached_dates = _load_exif_date_cache()
+    else:
+        exif_formats = frozenset()
+        cached_dates = {}
+    # The walk only lists directories; supported files are collected per
+    # directory, in walk order, and stat'ed afterwards
+    candidates: List[Tuple[str, List[Tuple[os.DirEntry, str]]]] = []
+    candidate_count = 0
 
     for folder_path in active_folders:
-        expanded_path = expand_path(folder_path)
+        # Normalizing the root makes every path below it normalized too, so
+        # callers can compare against normalize_path() output directly.
+        expanded_path = normalize_path(folder_path)
         if os.path.isdir(expanded_path):
             # Track folder modification time
             folder_mtimes[folder_path] = get_folder_mtime(expanded_path)
 
-            for root, dirs, files in os.walk(expanded_path):
-                for file in files:
-                    suffix = Path(file).suffix.lower()
+            for dirpath, entries in _walk_dirs(expanded_path):
+                files = []
+                for entry in entries:
+                    # Plain string slicing: no Path/splitext call per file.
+                    # dot > 0 skips extensionless names and dotfiles like
+                    # ".jpg", which have no suffix either.
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot <= 0:
+                        continue
+                    suffix = name[dot:].lower()
                     if suffix in SUPPORTED_FORMATS:
-                        full_path = os.path.join(root, file)
-
-                        # Single os.stat() call — used for the size check, EXIF cache
-                        # key, and filesystem date fallback. Avoids the separate
-                        # os.path.getsize() / os.path.getmtime() / os.path.getctime()
-                        # calls that were previously scattered across this loop.
-                        try:
-                            file_stat = os.stat(full_path)
-                            file_size = file_stat.st_size
-                            file_mtime = file_stat.st_mtime
-                            file_ctime = file_stat.st_ctime
-                        except OSError:
-                            continue  # Skip unreadable files
-
-                        # Check video size limit
-                        if suffix in VIDEO_FORMATS:
-                            if file_size > MAX_VIDEO_SIZE:
-                                continue  # Skip videos over size limit
-
-                        # Compute effective sort date.
-                        # Passing file stats lets get_effective_date() consult the
-                        # persistent EXIF cache and skip PIL for unchanged files.
-                        effective_date = get_effective_date(
-                            full_path, date_source, file_mtime, file_size, file_ctime
-                        )
-                        image_entries.append((full_path, effective_date))
-
-    # Sort newest-first by effective date
-    image_entries.sort(key=lambda x: x[1], reverse=True)
-    images = [entry[0] for entry in image_entries]
-
-    # Build folder index for O(1) lookups in get_images_by_folder()
-    folder_index: Dict[str, List[str]] = {}
-    for img_path in images:
-        folder = os.path.dirname(img_path)
-        if folder not in folder_index:
-            folder_index[folder] = []
-        folder_index[folder].append(img_path)
-
-    # Update cache — store effective dates too so get_leaf_folders can reuse them
-    _image_cache['images'] = images
-    _image_cache['effective_dates'] = {entry[0]: entry[1] for entry in image_entries}
-    _image_cache['timestamp'] = time.time()
-    _image_cache['folder_mtimes'] = folder_mtimes
-    _image_cache['date_source'] = date_source
-    _image_cache['folder_index'] = folder_index
+                        files.append((entry, suffix))
+                if files:
+                    candidates.append((dirpath, files))
+                    candidate_count += len(files)
+
+    _prefetch_stats(candidates, candidate_count)
+
+    for dirpath, files in candidates:
+        for entry, suffix in files:
+            # Single stat (DirEntry.stat() follows symlinks like os.stat, and
+            # is cached on the entry by _prefetch_stats) — used for the size
+            # check, EXIF cache key, and filesystem date fallback.
+            try:
+                file_stat = entry.stat()
+            except OSError:
+                continue  # Skip unreadable files
+            file_size = file_stat.st_size
+            file_mtime = file_stat.st_mtime
+
+            if suffix in exif_formats:
+                # Cached EXIF date: done, no fallback date needed
+                exif_ts = cached_dates.get((entry.path, int(file_mtime), file_size))
+                if exif_ts is not None:
+                    image_entries.append((entry.path, exif_ts, dirpath))
+                    continue
+            elif suffix in VIDEO_FORMATS and file_size > MAX_VIDEO_SIZE:
+                continue  # Skip videos over size limit
+
+            scanned.append((
+                len(image_entries), entry.path, file_mtime, file_size,
+                file_stat.st_ctime, suffix, dirpath,
+            ))
+            image_entries.append(None)
+
+    # Read EXIF for new or changed images in parallel before the date pass
+    _prefetch_exif_dates([
+        key for key in (
+            (path, int(mtime), size)
+            for _, path, mtime, size, _, suffix, _ in scanned if suffix in exif_formats
+        ) if not _is_exif_date_cached(key)
+    ])
+
+    # Compute the remaining effective sort dates, in walk order.
+    # The file stats let the EXIF lookup use the persistent EXIF cache and
+    # skip PIL for unchanged files.
+    if exif_dates:
+        effective_date_of = _effective_date_ctime if date_source == 'ctime' else _effective_date_mtime
+    else:
+        effective_date_of = _filesystem_date_ctime if date_source == 'ctime' else _filesystem_date_mtime
+    for index, full_path, file_mtime, file_size, file_ctime, suffix, folder in scanned:
+        effective_date = effective_date_of(full_path, suffix, file_mtime, file_size, file_ctime)
+        image_entries[index] = (full_path, effective_date, folder)
+
+    # Sort newest-first by effective date (itemgetter keys are extracted in C,
+    # no Python-level lambda call per entry)
+    image_entries.sort(key=itemgetter(1), reverse=True)
+    images = list(map(itemgetter(0), image_entries))
+
+    # Build folder index, using the folder recorded during the walk instead
+    # of splitting every path
+    folder_index, folder_newest = _build_folder_index(image_entries)
+
+    # New snapshot — store effective dates too so get_leaf_folders can reuse
+    # them (as packed doubles: 8 bytes each instead of a float object plus a
+    # path-keyed dict entry)
+    snapshot = _new_image_cache()
+    snapshot['images'] = images
+    snapshot['date_array'] = array('d', map(itemgetter(1), image_entries))
+    snapshot['timestamp'] = snapshot['last_validated'] = snapshot['scanned_at'] = time.monotonic()
+    snapshot['folders'] = list(active_folders)
+    snapshot['folder_mtimes'] = folder_mtimes
+    snapshot['date_source'] = date_source
+    snapshot['exif_dates'] = exif_dates
+    snapshot['folder_index'] = folder_index
+    snapshot['folder_newest'] = folder_newest
+    _image_cache = snapshot
+    _prewarm_wake.set()
 
     # Persist any newly discovered EXIF dates to disk so the next server restart
     # (or cache TTL expiry) doesn't have to re-open unchanged files with Pillow.
     _save_exif_date_cache()
+    _save_image_list_cache(snapshot)
+
+    return snapshot
+
+
+def _get_image_snapshot() -> Dict[str, Any]:
+    """Return a valid image list cache snapshot, rescanning if needed.
+
+    Callers should read everything they need from the one returned dict
+    rather than from _image_cache, which a concurrent scan may replace.
+    """
+    global _image_list_cache_checked, _last_request_at
 
-    return images
+    _last_request_at = time.monotonic()
+    _ensure_prewarmer()
+
+    # Fetched once here and handed to the validity check, which runs on
+    # every request
+    settings = get_optimization_settings()
+    date_source = settings.get('date_source', 'mtime')
+    # Active folders (profile-aware fallback to global config)
+    active_folders = get_current_folders()
+
+    # Check cache validity — also bust cache when date_source setting changed
+    snapshot = _image_cache
+    if _is_cache_valid_with_date_source(snapshot, date_source, settings, active_folders):
+        return snapshot
+
+    with _scan_lock:
+        # First call in this process: start from the last saved scan, if any
+        if not _image_list_cache_checked:
+            _image_list_cache_checked = True
+            if _image_cache['images'] is None:
+                _load_image_list_cache()
+
+        # Another thread may have rescanned while this one waited
+        snapshot = _image_cache
+        if _is_cache_valid_with_date_source(snapshot, date_source, settings, active_folders):
+            return snapshot
+
+        # Cache miss or invalid - rescan.  The new snapshot starts without
+        # leaf folders, so they are rebuilt for the current profile's folders.
+        return _scan_images(active_folders, date_source, settings.get('exif_dates', True))
+
+
+def get_all_images() -> List[str]:
+    """Scan all configured folders and return list of image paths (with caching).
+
+    Images are sorted using a date hierarchy:
+      1. EXIF DateTimeOriginal (shutter time — most accurate)
+      2. EXIF DateTimeDigitized (digitization time)
+      3. Filesystem date determined by the ``date_source`` setting
+         (``'mtime'`` → modification time first; ``'ctime'`` → creation time first)
+
+    Returns:
+        List of image file paths, sorted newest-first by effective date.
+    """
+    return _get_image_snapshot()['images']
+
+
+def get_all_images_with_urls() -> Tuple[List[str], List[str]]:
+    """Return the cached image list together with its URL list.
+
+    The URL list is parallel to the image list (``urls[i]`` is
+    ``format_image_url(images[i])``) and is built once per scan and URL
+    prefix, so feed requests don't re-encode every path.  Both lists come
+    from the same scan; callers must treat them as read-only.
+
+    Returns:
+        Tuple of (image paths, image URLs), sorted newest-first.
+    """
+    snapshot = _get_image_snapshot()
+    images = snapshot['images']
+    prefix = get_image_url_prefix()
+    url_lists: Dict[str, List[str]] = snapshot['image_urls']
+    urls = url_lists.get(prefix)
+    if urls is None:
+        urls = [prefix + quote_path(img) for img in images]
+        url_lists[prefix] = urls
+    return images, urls
 
 
 def get_images_by_folder(folder_path: str) -> List[str]:
@@ -392,17 +1092,16 @@ def get_images_by_folder(folder_path: str) -> List[str]:
         List of image file paths in that folder, sorted newest-first.
     """
     # Ensure the cache (and folder index) is populated
-    get_all_images()
-    folder_index: Dict[str, List[str]] = _image_cache.get('folder_index', {})
+    folder_index: Dict[str, List[str]] = _get_image_snapshot()['folder_index']
     return list(folder_index.get(folder_path, []))
 
 
 def get_leaf_folders() -> List[Dict[str, Any]]:
     """Get list of all leaf folders (folders that actually contain images).
 
-    Uses cached image list and caches the computed folder data.
-    Folder cache is invalidated when image cache is invalidated or when
-    the current profile's folder list changes.
+    Built from the cached image list and cached with it, so the result is
+    rebuilt whenever the image list is rescanned (including when the current
+    profile's folder list changes).
 
     The ``newest_mtime`` field is populated from the same effective date used for
     sorting (EXIF → filesystem fallback), so folder ordering in the nav is
@@ -411,47 +1110,19 @@ def get_leaf_folders() -> List[Dict[str, Any]]:
     Returns:
         List of folder info dicts with path, name, count, and newest_mtime
     """
-    global _leaf_folders_cache
-
-    # Check if cache is still valid
-    # The image cache is profile-aware, so if the profile's folders change,
-    # get_all_images() will invalidate the image cache, which we should respect
-    if _leaf_folders_cache:
-        # Verify cache is actually based on the current folders
-        from app.services.profiles import get_current_folders
-        current_folders = set(get_current_folders())
-        # Get the folders that were used to build the cache (stored in image cache)
-        cached_mtimes = _image_cache.get('folder_mtimes', {})
-        if current_folders == set(cached_mtimes.keys()):
-            # Cache is valid for this profile
-            return _leaf_folders_cache
-
-    # Compute folder data from image list
-    images = get_all_images()
-
-    # Reuse the effective dates already computed during get_all_images()
-    effective_dates: Dict[str, float] = _image_cache.get('effective_dates', {})
-
-    # Count images and track newest effective date per folder
-    folder_data: Dict[str, Dict[str, Any]] = {}
-    for img in images:
-        folder = os.path.dirname(img)
-        if folder not in folder_data:
-            folder_data[folder] = {'count': 0, 'newest_mtime': 0}
-        folder_data[folder]['count'] += 1
-        # Use cached effective date; fall back to filesystem mtime if unavailable
-        eff = effective_dates.get(img)
-        if eff is None:
-            try:
-                eff = os.path.getmtime(img)
-            except OSError:
-                eff = 0
-        if eff > folder_data[folder]['newest_mtime']:
-            folder_data[folder]['newest_mtime'] = eff
+    # Make sure the image list (and its per-folder data) is current
+    snapshot = _get_image_snapshot()
+    if snapshot['leaf_folders'] is not None:
+        return snapshot['leaf_folders']
+
+    # Counts and newest effective dates come straight from the per-folder
+    # data built by the scan — no pass over the whole image list
+    folder_index: Dict[str, List[str]] = snapshot['folder_index']
+    folder_newest: Dict[str, float] = snapshot['folder_newest']
 
     # Convert to list of folder info objects
     folders = []
-    for folder_path, data in folder_data.items():
+    for folder_path, folder_images in folder_index.items():
         # Extract folder name (last component of path)
         parts = folder_path.replace('\\', '/').split('/')
         folder_name = parts[-1] if parts else folder_path
@@ -459,18 +1130,11 @@ def get_leaf_folders() -> List[Dict[str, Any]]:
         folders.append({
             'path': folder_path,
             'name': folder_name,
-            'count': data['count'],
-            'newest_mtime': data['newest_mtime']
+            'count': len(folder_images),
+            'newest_mtime': folder_newest[folder_path]
         })
 
-    # Cache the result
-    _leaf_folders_cache = folders
+    # Cache the result with the snapshot it was built from
+    snapshot['leaf_folders'] = folders
 
     return folders
-
-
-# ---------------------------------------------------------------------------
-# Module initialisation — load persistent EXIF cache from disk so it is
-# available immediately on the first scan after a server restart.
-# ---------------------------------------------------------------------------
-_load_exif_date_cache()
@@ -0,0 +1,177 @@
+"""
+JSON helpers for HomeFeed.
+Uses orjson when it is installed (much faster parsing and serialization) and
+falls back to the standard library json module otherwise.
+"""
+
+import json
+import mmap
+import os
+import threading
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, Union
+
+from flask import Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# load_file() parses files at least this large straight from an mmap
+_MMAP_MIN_BYTES = 1 << 20
+
+# On Windows, os.replace() fails while another handle has the destination
+# open; write_file() retries this many times, this many seconds apart
+_REPLACE_RETRIES = 20
+_REPLACE_RETRY_DELAY = 0.05
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes.
+
+    Raises:
+        ValueError: If the document is not valid JSON (json.JSONDecodeError
+            and orjson.JSONDecodeError are both ValueError subclasses).
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(filepath: str) -> Any:
+    """Parse the JSON file at filepath.
+
+    With orjson, files of _MMAP_MIN_BYTES or more are memory-mapped and
+    parsed from the mapping, so a multi-megabyte EXIF cache or data file is
+    never copied into an intermediate bytes object (and the pages come
+    straight from the OS page cache shared by all workers).
+
+    Raises:
+        ValueError: If the file is not valid JSON.
+        OSError: If the file can't be opened or read.
+    """
+    with open(filepath, 'rb') as f:
+        if not HAS_ORJSON or os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def write_file(filepath: str, obj: Any, indent: bool = False) -> None:
+    """Serialize obj and atomically replace filepath with it.
+
+    The JSON goes to a temporary sibling (unique per process and thread) that
+    is then swapped in with os.replace, so readers never see a torn or
+    half-written file, and a crash mid-write leaves the previous version
+    intact.  No fsync: durability is left to the OS, as before.
+
+    On POSIX, readers that already have the old file open (or mapped by
+    load_file()) keep reading the old version.  On Windows the replace
+    fails with PermissionError while any reader has the file open, so it
+    is retried for up to about a second until the read finishes.
+
+    Args:
+        filepath: Destination path
+        obj: Object to serialize
+        indent: Pretty-print (see dumps())
+    """
+    tmp_path = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(obj, indent=indent))
+        _replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _replace(src: str, dst: str) -> None:
+    """os.replace(), retrying on Windows while dst is open elsewhere."""
+    for _ in range(_REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if os.name != 'nt':
+                raise
+            time.sleep(_REPLACE_RETRY_DELAY)
+    os.replace(src, dst)  # Last attempt: let the error propagate
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (no trailing newline).
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (for files people
+            may open by hand); compact otherwise
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def ojsonify(obj: Any) -> Response:
+    """Build a JSON response directly from dumps().
+
+    Used by endpoints returning large image URL lists: skips jsonify's
+    argument handling and debug pretty-printing and encodes in one call.
+    """
+    return Response(dumps(obj), mimetype='application/json')
+
+
+def ojsonify_stream(items: Iterable[Any], batch_size: int = 1000) -> Response:
+    """Stream an iterable as a JSON array response.
+
+    Items are consumed lazily and encoded batch_size at a time, so the first
+    bytes go out before the whole list exists and neither the full list nor
+    its serialized form has to be held in memory.  The request context is
+    kept alive for the generator, so items may be produced with helpers that
+    use flask.g (e.g. format_image_url).
+    """
+    def generate() -> Iterator[bytes]:
+        it = iter(items)
+        yield b'['
+        separator = b''
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
+            # dumps() of the batch gives "[a,b,c]"; strip the brackets
+            yield separator + dumps(batch)[1:-1]
+            separator = b','
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Honours the provider's ``sort_keys`` setting and Flask's debug-mode
+    pretty printing so ``jsonify`` output keeps the same shape as the
+    default provider.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get('default', self.default)
+        return orjson.dumps(obj, default=default, option=option).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
@@ -4,6 +4,7 @@ Handles path validation, normalization, and security checks.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 from urllib.parse import quote, unquote
 
@@ -40,8 +41,11 @@ def expand_path(path_str: str) -> str:
     return os.path.expanduser(path_str)
 
 
+@lru_cache(maxsize=131072)
 def normalize_path(path_str: str) -> str:
     """Expand and normalize a path for consistent comparison.
+
+    Memoized: the same paths arrive on every seen/trash/favorites request.
     
     Args:
         path_str: The path string to normalize
@@ -103,6 +107,16 @@ def validate_and_normalize_path(request_path: Optional[str]) -> Tuple[Optional[s
     return normalized, None
 
 
+@lru_cache(maxsize=131072)
+def quote_path(image_path: str) -> str:
+    """URL-encode a file path for a ?path= query parameter (memoized).
+
+    urllib's quote() is pure Python; the same library paths are encoded
+    on every feed request, so repeat calls become a dict lookup.
+    """
+    return quote(image_path, safe='')
+
+
 def format_image_url(image_path: str) -> str:
     """Format an image path as a URL-encoded URL.
     
@@ -115,11 +129,35 @@ def format_image_url(image_path: str) -> str:
     Returns:
         A URL string for the image
     """
+    return get_image_url_prefix() + quote_path(image_path)
+
+
+def get_image_url_prefix() -> str:
+    """Return the URL prefix format_image_url() puts before the quoted path.
+
+    '/thumbnail?path=' when the thumbnail cache is enabled, '/image?path='
+    otherwise.
+    """
     optimizations = _get_optimization_settings()
     if optimizations.get('thumbnail_cache', False):
-        return f'/thumbnail?path={quote(image_path, safe="")}'
+        return '/thumbnail?path='
     else:
-        return f'/image?path={quote(image_path, safe="")}'
+        return '/image?path='
+
+
+def format_full_image_url(image_path: str) -> str:
+    """Format an image path as a URL-encoded /image URL (never a thumbnail).
+
+    Args:
+        image_path: The full path to the image file
+
+    Returns:
+        A URL string for the original image
+    """
+    return '/image?path=' + quote_path(image_path)
+
+
+_URL_PATH_PREFIXES = ('/image?path=', '/thumbnail?path=')
 
 
 def extract_path_from_url(url_path: str) -> str:
@@ -134,8 +172,11 @@ def extract_path_from_url(url_path: str) -> str:
         The decoded file path
     """
     path = url_path
-    if path.startswith('/thumbnail?path='):
-        path = path.replace('/thumbnail?path=', '', 1)
-    elif path.startswith('/image?path='):
-        path = path.replace('/image?path=', '', 1)
+    # Raw paths (the common case for batch calls) start with neither prefix,
+    # so one C-level startswith() settles it before any slicing
+    if path.startswith(_URL_PATH_PREFIXES):
+        if path.startswith('/image?path='):
+            path = path[len('/image?path='):]
+        else:
+            path = path[len('/thumbnail?path='):]
     return unquote(path)
@@ -7,15 +7,16 @@ Each profile has its own favorites, watch history, and folder configuration.
 
 import copy
 import os
-import json
 import hashlib
 import secrets
 import time
 from typing import Optional, Dict, List, Any, Tuple
 from filelock import FileLock
-from flask import session
+from flask import g, session
 
 from app.config import PROFILES_FILE, PROFILES_DIR
+from app.services import seen_db
+from app.services.json_utils import loads as json_loads, write_file as json_write_file
 
 
 PROFILE_SESSION_KEY = 'profile_id'
@@ -28,72 +29,135 @@ _UNSET = object()
 # profiles.json is read on almost every request (before_request, is_path_allowed,
 # get_current_folders, etc.).  Caching it in memory eliminates the disk I/O
 # storm that occurred when serving thousands of images on page load.
-# Cache is updated immediately on every save_profiles() call.
+# The file is re-parsed only when its stat changes (so a save by another
+# worker shows up immediately; the inode changes with every save, even where
+# mtime is too coarse to), and the cache is updated on every save_profiles()
+# call.
 # ---------------------------------------------------------------------------
 
-_PROFILES_CACHE_TTL = 60.0  # seconds between forced re-reads from disk
-_profiles_cache: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+# (data, st_mtime_ns, st_size, st_ino) of the last parse of profiles.json
+_profiles_cache: Tuple[Optional[Dict[str, Any]], int, int, int] = (None, 0, 0, 0)
+# id -> profile index, rebuilt whenever _profiles_cache holds a new object
+_profiles_index: Tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]] = (None, {})
 
 
 # ---------------------------------------------------------------------------
 # Password helpers
 # ---------------------------------------------------------------------------
 
+# Stored hashes are "<salt>:<hex digest>", where the salt is a 32-character
+# hex string used as-is (its ASCII bytes) — kept for existing profiles.json
+_PBKDF2_ITERATIONS = 100_000
+
+
 def _hash_password(password: str) -> str:
     """Hash a password with a random salt using PBKDF2."""
     salt = secrets.token_hex(16)
-    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100_000)
+    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), _PBKDF2_ITERATIONS)
     return f"{salt}:{dk.hex()}"
 
 
 def _verify_password(password: str, stored_hash: str) -> bool:
     """Verify a password against a stored PBKDF2 hash."""
-    parts = stored_hash.split(':', 1)
-    if len(parts) != 2:
+    salt, sep, stored_dk = stored_hash.partition(':')
+    if not sep:
         return False
-    salt, stored_dk = parts
-    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100_000)
-    return secrets.compare_digest(dk.hex(), stored_dk)
+    try:
+        expected = bytes.fromhex(stored_dk)
+    except ValueError:
+        return False
+    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), _PBKDF2_ITERATIONS)
+    # Raw digests compared directly, without hex-encoding the new one
+    return secrets.compare_digest(dk, expected)
 
 
 # ---------------------------------------------------------------------------
 # Profiles file I/O
 # ---------------------------------------------------------------------------
 
+def _load_profiles_cached() -> Dict[str, Any]:
+    """Return the shared cached profiles dict, re-reading it when the file changed.
+
+    Costs one stat() when profiles.json is unchanged, at most once per
+    request: the result is also kept on flask.g, so the profile checks in
+    before_request, get_profile() and the routes share one lookup.  Callers
+    must not modify the returned dict.
+    """
+    global _profiles_cache
+    # Plain attribute access: a miss raises AttributeError (first call in a
+    # request) or RuntimeError (outside a request context)
+    try:
+        return g._homefeed_profiles_data
+    except (AttributeError, RuntimeError):
+        pass
+
+    try:
+        st = os.stat(PROFILES_FILE)
+    except OSError:
+        result = {'profiles': []}
+    else:
+        cached_data, cached_mtime_ns, cached_size, cached_ino = _profiles_cache
+        if (cached_data is not None and cached_mtime_ns == st.st_mtime_ns
+                and cached_size == st.st_size and cached_ino == st.st_ino):
+            result = cached_data
+        else:
+            # Cache miss or file changed — read from disk
+            try:
+                with open(PROFILES_FILE, 'rb') as f:
+                    result = json_loads(f.read())
+            except (ValueError, IOError):
+                result = {'profiles': []}
+            _profiles_cache = (result, st.st_mtime_ns, st.st_size, st.st_ino)
+
+    try:
+        g._homefeed_profiles_data = result
+    except RuntimeError:
+        pass
+    return result
+
+
 def load_profiles() -> Dict[str, Any]:
     """Load profiles data from profiles.json (with in-memory caching).
 
     Returns a deep copy so callers can freely modify the dict without
-    corrupting the cache.
+    corrupting the cache.  Read-only callers use _load_profiles_cached().
     """
-    global _profiles_cache
-    cached_data, cached_ts = _profiles_cache
-    if cached_data is not None and (time.time() - cached_ts) < _PROFILES_CACHE_TTL:
-        return copy.deepcopy(cached_data)
+    return copy.deepcopy(_load_profiles_cached())
 
-    # Cache miss or expired — read from disk
-    if os.path.exists(PROFILES_FILE):
-        try:
-            with open(PROFILES_FILE, 'r') as f:
-                result = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            result = {'profiles': []}
-    else:
-        result = {'profiles': []}
 
-    _profiles_cache = (result, time.time())
-    return copy.deepcopy(result)
+def _get_profiles_index() -> Dict[str, Dict[str, Any]]:
+    """Return a profile_id -> profile dict index of the cached profiles.
+
+    Rebuilt only when the profiles cache is refreshed or saved.  Callers must
+    not modify the returned dicts.
+    """
+    global _profiles_index
+    data = _load_profiles_cached()
+    indexed_data, index = _profiles_index
+    if indexed_data is not data:
+        index = {p['id']: p for p in data.get('profiles', [])}
+        _profiles_index = (data, index)
+    return index
 
 
 def save_profiles(data: Dict[str, Any]) -> None:
-    """Save profiles data to profiles.json and update the in-memory cache."""
+    """Save profiles data to profiles.json and update the in-memory cache.
+
+    data becomes the cached dict itself (no copy), so callers must not modify
+    it after saving; every caller passes the copy it got from load_profiles().
+    """
     global _profiles_cache
     lock = FileLock(PROFILES_FILE + '.lock')
     with lock:
-        with open(PROFILES_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        json_write_file(PROFILES_FILE, data, indent=True)
+        # Stat while still holding the lock so no other writer can slip in
+        st = os.stat(PROFILES_FILE)
     # Update cache so subsequent reads don't need to hit disk
-    _profiles_cache = (copy.deepcopy(data), time.time())
+    _profiles_cache = (data, st.st_mtime_ns, st.st_size, st.st_ino)
+    try:
+        g._homefeed_profiles_data = _profiles_cache[0]
+    except RuntimeError:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -102,13 +166,13 @@ def save_profiles(data: Dict[str, Any]) -> None:
 
 def profiles_exist() -> bool:
     """Return True if at least one profile has been created."""
-    data = load_profiles()
+    data = _load_profiles_cached()
     return len(data.get('profiles', [])) > 0
 
 
 def get_profiles_public() -> List[Dict[str, Any]]:
     """Return profiles list safe for the picker UI (no password hashes)."""
-    data = load_profiles()
+    data = _load_profiles_cached()
     return [
         {
             'id': p['id'],
@@ -123,11 +187,8 @@ def get_profiles_public() -> List[Dict[str, Any]]:
 
 def get_profile(profile_id: str) -> Optional[Dict[str, Any]]:
     """Get a full profile record by ID (includes password hash for internal use)."""
-    data = load_profiles()
-    for p in data.get('profiles', []):
-        if p['id'] == profile_id:
-            return p
-    return None
+    profile = _get_profiles_index().get(profile_id)
+    return dict(profile) if profile is not None else None
 
 
 def create_profile(
@@ -225,6 +286,9 @@ def delete_all_profiles(except_profile_id: str) -> int:
     for p in to_delete:
         profile_dir = get_profile_dir(p['id'])
         if os.path.exists(profile_dir):
+            # Release this worker's open seen.db first, or the deleted file
+            # stays open (and on Windows can't be removed at all)
+            seen_db.close_all_under(profile_dir)
             shutil.rmtree(profile_dir, ignore_errors=True)
 
     data['profiles'] = [p for p in data.get('profiles', []) if p['id'] == except_profile_id]
@@ -298,6 +362,28 @@ def is_profile_selected() -> bool:
     return get_current_profile_id() is not None
 
 
+def get_current_profile() -> Optional[Dict[str, Any]]:
+    """Return the full record of the profile selected in this session, or None.
+
+    Result is cached on flask.g for the duration of the current request.
+    """
+    try:
+        cached = getattr(g, '_homefeed_current_profile', _UNSET)
+        if cached is not _UNSET:
+            return cached
+    except RuntimeError:
+        pass
+
+    profile_id = get_current_profile_id()
+    result = get_profile(profile_id) if profile_id else None
+
+    try:
+        g._homefeed_current_profile = result
+    except RuntimeError:
+        pass
+    return result
+
+
 def is_current_profile_admin() -> bool:
     """Return True if the current profile has the admin role.
 
@@ -311,22 +397,19 @@ def is_current_profile_admin() -> bool:
     Result is cached on flask.g for the duration of the current request.
     """
     try:
-        from flask import g
         cached = getattr(g, '_homefeed_is_admin', _UNSET)
         if cached is not _UNSET:
             return cached
     except RuntimeError:
         pass
 
-    profile_id = get_current_profile_id()
-    if not profile_id:
+    if not get_current_profile_id():
         result = not profiles_exist()
     else:
-        profile = get_profile(profile_id)
+        profile = get_current_profile()
         result = bool(profile and profile.get('role') == 'admin')
 
     try:
-        from flask import g
         g._homefeed_is_admin = result
     except RuntimeError:
         pass
@@ -342,26 +425,40 @@ _PROFILE_CONFIG_CACHE_TTL = 60.0
 _profile_config_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
 
 
-def load_profile_config(profile_id: str) -> Dict[str, Any]:
-    """Load the folder/config data for a specific profile (with in-memory caching)."""
+def load_profile_config_readonly(profile_id: str) -> Dict[str, Any]:
+    """Return the shared cached config dict of a profile, re-reading it when expired.
+
+    For read-only callers (e.g. get_current_folders() on every request):
+    skips load_profile_config()'s deep copy.  The returned dict is the cache
+    itself and must not be modified.
+    """
     cached = _profile_config_cache.get(profile_id)
     if cached is not None:
         data, ts = cached
-        if (time.time() - ts) < _PROFILE_CONFIG_CACHE_TTL:
-            return copy.deepcopy(data)
+        if (time.monotonic() - ts) < _PROFILE_CONFIG_CACHE_TTL:
+            return data
 
     config_file = get_profile_data_file(profile_id, 'config.json')
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                result = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(config_file, 'rb') as f:
+                result = json_loads(f.read())
+        except (ValueError, IOError):
             result = {'folders': []}
     else:
         result = {'folders': []}
 
-    _profile_config_cache[profile_id] = (result, time.time())
-    return copy.deepcopy(result)
+    _profile_config_cache[profile_id] = (result, time.monotonic())
+    return result
+
+
+def load_profile_config(profile_id: str) -> Dict[str, Any]:
+    """Load the folder/config data for a specific profile (with in-memory caching).
+
+    Returns a deep copy so callers can freely modify the dict without
+    corrupting the cache.
+    """
+    return copy.deepcopy(load_profile_config_readonly(profile_id))
 
 
 def save_profile_config(profile_id: str, config: Dict[str, Any]) -> None:
@@ -369,9 +466,8 @@ def save_profile_config(profile_id: str, config: Dict[str, Any]) -> None:
     config_file = get_profile_data_file(profile_id, 'config.json')
     lock = FileLock(config_file + '.lock')
     with lock:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-    _profile_config_cache[profile_id] = (copy.deepcopy(config), time.time())
+        json_write_file(config_file, config, indent=True)
+    _profile_config_cache[profile_id] = (copy.deepcopy(config), time.monotonic())
 
 
 def get_current_folders() -> List[str]:
@@ -385,35 +481,34 @@ def get_current_folders() -> List[str]:
 
     Result is cached on flask.g for the duration of the current request so
     multiple callers within the same request (before_request, is_path_allowed,
-    cache validity checks) only compute this once.
+    cache validity checks) only compute this once.  The list may be shared
+    with the config cache, so callers must not modify it.
     """
     # Per-request cache
     try:
-        from flask import g
         cached = getattr(g, '_homefeed_current_folders', _UNSET)
         if cached is not _UNSET:
             return cached
     except RuntimeError:
         pass  # Outside request context (tests, background tasks)
 
-    from app.services.data import load_config
+    from app.services.data import load_config_readonly
     profile_id = get_current_profile_id()
     if profile_id and is_profiles_active():
-        profile = get_profile(profile_id)
+        profile = get_current_profile()
         if profile and profile.get('role') == 'admin':
             # Admins always see the full global folder list
-            config = load_config()
+            config = load_config_readonly()
             result = config.get('folders', [])
         else:
-            config = load_profile_config(profile_id)
+            config = load_profile_config_readonly(profile_id)
             result = config.get('folders', [])
     else:
         # Fallback: global config
-        config = load_config()
+        config = load_config_readonly()
         result = config.get('folders', [])
 
     try:
-        from flask import g
         g._homefeed_current_folders = result
     except RuntimeError:
         pass
@@ -422,8 +517,8 @@ def get_current_folders() -> List[str]:
 
 def get_profiles_enabled() -> bool:
     """Return True if the profiles feature is enabled in config."""
-    from app.services.data import load_config
-    config = load_config()
+    from app.services.data import load_config_readonly
+    config = load_config_readonly()
     return bool(config.get('profiles_enabled', False))
 
 
@@ -443,7 +538,6 @@ def is_profiles_active() -> bool:
     Result is cached on flask.g for the duration of the current request.
     """
     try:
-        from flask import g
         cached = getattr(g, '_homefeed_profiles_active', _UNSET)
         if cached is not _UNSET:
             return cached
@@ -453,7 +547,6 @@ def is_profiles_active() -> bool:
     result = profiles_exist() and get_profiles_enabled()
 
     try:
-        from flask import g
         g._homefeed_profiles_active = result
     except RuntimeError:
         pass
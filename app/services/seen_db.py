@@ -0,0 +1,218 @@
+"""
+SQLite storage for seen (watch history) data.
+
+Each seen database (the global seen.db, or one per profile) holds:
+
+    seen(path TEXT PRIMARY KEY, first_seen REAL, seen_count INTEGER, last_seen REAL)
+    meta(key TEXT PRIMARY KEY, value INTEGER)   -- total_scrolls, seen_count, version
+
+Marking a batch as seen is a handful of indexed inserts/updates instead of
+re-serializing a JSON file that grows with the library.  WAL mode lets other
+workers keep reading while one writes.  A legacy seen.json next to the
+database is imported the first time the database is opened.
+"""
+
+import os
+import sqlite3
+import threading
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from app.services import sqlite_utils
+from app.services.json_utils import load_file as json_load_file
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS seen (
+    path TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    seen_count INTEGER NOT NULL,
+    last_seen REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES
+    ('total_scrolls', 0), ('seen_count', 0), ('version', 0);
+'''
+
+# db path -> (meta version, frozenset of seen paths); rebuilt only after a write
+_path_sets: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+
+# ---------------------------------------------------------------------------
+# Connections and migration
+# ---------------------------------------------------------------------------
+
+def _connect(db_path: str) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Return the shared connection (and its lock) for db_path, opening it once."""
+    return sqlite_utils.connect(db_path, _init_db)
+
+
+def _init_db(conn: sqlite3.Connection, db_path: str) -> None:
+    """Create the schema and import a legacy seen.json (new connections only)."""
+    conn.executescript(_SCHEMA)
+    _migrate_legacy_json(conn, os.path.splitext(db_path)[0] + '.json')
+
+
+def close(db_path: str) -> None:
+    """Close this process's connection to db_path, if it has one.
+
+    The next call for db_path opens a new connection (and recreates the
+    database if it was deleted).
+    """
+    sqlite_utils.close(db_path)
+    _path_sets.pop(db_path, None)
+
+
+def close_all_under(directory: str) -> None:
+    """Close this process's connections to every database inside directory.
+
+    Called before a directory of seen databases is deleted, so the files
+    aren't held open (or, on Windows, left undeletable) afterwards.
+    """
+    for db_path in sqlite_utils.close_all_under(directory):
+        _path_sets.pop(db_path, None)
+
+
+def _migrate_legacy_json(conn: sqlite3.Connection, json_path: str) -> None:
+    """Import a legacy seen.json into a new database (once).
+
+    The JSON file is left in place as a backup; a 'migrated' meta row stops
+    it from being imported again.
+    """
+    if _get_meta(conn, 'migrated') is not None:
+        return
+    with sqlite_utils.write_transaction(conn):
+        if _get_meta(conn, 'migrated') is not None:
+            return  # Another worker got here first
+        try:
+            data = json_load_file(json_path)
+        except (ValueError, OSError):
+            data = {}
+        seen = data.get('seen', {}) if isinstance(data, dict) else {}
+        conn.executemany(
+            'INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)',
+            (
+                (path, entry.get('first_seen', 0), entry.get('seen_count', 1), entry.get('last_seen', 0))
+                for path, entry in seen.items() if isinstance(entry, dict)
+            ),
+        )
+        seen_count = conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+        _set_meta(conn, 'seen_count', seen_count)
+        _set_meta(conn, 'total_scrolls', int(data.get('total_scrolls', 0)) if isinstance(data, dict) else 0)
+        _set_meta(conn, 'migrated', 1)
+        _bump_version(conn)
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Any:
+    row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: int) -> None:
+    conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+
+def _bump_version(conn: sqlite3.Connection) -> None:
+    """Mark the seen table as changed (invalidates cached path sets in every worker)."""
+    conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def mark_seen(db_path: str, paths: List[str], now: float) -> Tuple[int, int]:
+    """Mark paths as seen at time now.
+
+    New paths get first_seen = last_seen = now and seen_count 1; already-seen
+    paths get seen_count + 1 and last_seen = now.  total_scrolls grows by the
+    number of new paths.  A path repeated within one batch counts once.
+
+    Returns:
+        Tuple of (total_scrolls, seen_count) after the update.
+    """
+    # Drop repeats (keeping order) so each path costs one insert/update
+    paths = list(dict.fromkeys(paths))
+    conn, lock = _connect(db_path)
+    with lock, sqlite_utils.write_transaction(conn):
+        before = conn.total_changes
+        conn.executemany(
+            'INSERT OR IGNORE INTO seen VALUES (?, ?, 0, ?)',
+            [(path, now, now) for path in paths],
+        )
+        new_count = conn.total_changes - before
+        conn.executemany(
+            'UPDATE seen SET seen_count = seen_count + 1, last_seen = ? WHERE path = ?',
+            [(now, path) for path in paths],
+        )
+        conn.execute(
+            "UPDATE meta SET value = value + ? WHERE key IN ('total_scrolls', 'seen_count')",
+            (new_count,),
+        )
+        _bump_version(conn)
+        return _get_meta(conn, 'total_scrolls'), _get_meta(conn, 'seen_count')
+
+
+def get_seen_paths(db_path: str) -> FrozenSet[str]:
+    """Return every seen path as a frozenset.
+
+    Cached per database and rebuilt only when the meta version shows a write
+    (from any worker) since the last call, so the unseen feed normally costs
+    one small query.
+    """
+    conn, lock = _connect(db_path)
+    with lock:
+        version = _get_meta(conn, 'version')
+        cached = _path_sets.get(db_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        paths = frozenset(map(itemgetter(0), conn.execute('SELECT path FROM seen')))
+    _path_sets[db_path] = (version, paths)
+    return paths
+
+
+def get_seen_counts(db_path: str) -> Tuple[int, int]:
+    """Return (seen_count, total_scrolls) without touching the seen table."""
+    conn, lock = _connect(db_path)
+    with lock:
+        return _get_meta(conn, 'seen_count'), _get_meta(conn, 'total_scrolls')
+
+
+def load_seen_data(db_path: str) -> Dict[str, Any]:
+    """Return the whole database in the legacy seen.json shape.
+
+    Returns:
+        Dict with 'seen' (dict of path -> metadata) and 'total_scrolls' (int)
+    """
+    conn, lock = _connect(db_path)
+    with lock:
+        rows = conn.execute('SELECT path, first_seen, seen_count, last_seen FROM seen').fetchall()
+        total_scrolls = _get_meta(conn, 'total_scrolls')
+    return {
+        'seen': {
+            path: {'first_seen': first_seen, 'seen_count': seen_count, 'last_seen': last_seen}
+            for path, first_seen, seen_count, last_seen in rows
+        },
+        'total_scrolls': total_scrolls,
+    }
+
+
+def replace_seen_data(db_path: str, data: Dict[str, Any]) -> None:
+    """Replace the whole database with data in the legacy seen.json shape."""
+    seen = data.get('seen', {})
+    conn, lock = _connect(db_path)
+    with lock, sqlite_utils.write_transaction(conn):
+        conn.execute('DELETE FROM seen')
+        conn.executemany(
+            'INSERT INTO seen VALUES (?, ?, ?, ?)',
+            (
+                (path, entry['first_seen'], entry['seen_count'], entry['last_seen'])
+                for path, entry in seen.items()
+            ),
+        )
+        _set_meta(conn, 'seen_count', len(seen))
+        _set_meta(conn, 'total_scrolls', data.get('total_scrolls', 0))
+        _bump_version(conn)
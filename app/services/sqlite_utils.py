@@ -0,0 +1,88 @@
+"""
+Shared SQLite connection handling for HomeFeed's databases (seen_db, exif_db).
+
+Each database gets one connection per process, shared by all threads and
+paired with a lock (a sqlite3 connection must not be used by two threads at
+once).  Connections run in autocommit mode with WAL journaling, so other
+workers keep reading while one writes; write transactions are opened
+explicitly with write_transaction().
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+# Entries record the owning pid so a forked worker opens its own connection
+_connections: Dict[str, Tuple[sqlite3.Connection, threading.Lock, int]] = {}
+_connections_lock = threading.Lock()
+
+
+def connect(
+    db_path: str,
+    init: Callable[[sqlite3.Connection, str], None],
+) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Return the shared connection (and its lock) for db_path, opening it once.
+
+    Args:
+        db_path: Path to the database file (created if missing).
+        init: Called as init(conn, db_path) when a connection is first opened
+            in this process, to create the schema and run migrations.
+    """
+    entry = _connections.get(db_path)
+    if entry is not None and entry[2] == os.getpid():
+        return entry[0], entry[1]
+
+    with _connections_lock:
+        entry = _connections.get(db_path)
+        if entry is not None and entry[2] == os.getpid():
+            return entry[0], entry[1]
+        conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        init(conn, db_path)
+        lock = threading.Lock()
+        _connections[db_path] = (conn, lock, os.getpid())
+        return conn, lock
+
+
+def close(db_path: str) -> None:
+    """Close this process's connection to db_path, if it has one.
+
+    The next connect() for db_path opens a new connection (and recreates the
+    database if it was deleted).
+    """
+    with _connections_lock:
+        entry = _connections.pop(db_path, None)
+    # A connection inherited across fork() belongs to the parent: just drop it
+    if entry is not None and entry[2] == os.getpid():
+        conn, lock, _ = entry
+        with lock:
+            conn.close()
+
+
+def close_all_under(directory: str) -> List[str]:
+    """Close this process's connections to every database inside directory.
+
+    Returns:
+        The database paths whose connections were closed.
+    """
+    prefix = os.path.join(os.path.abspath(directory), '')
+    closed = [db_path for db_path in list(_connections) if os.path.abspath(db_path).startswith(prefix)]
+    for db_path in closed:
+        close(db_path)
+    return closed
+
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """BEGIN IMMEDIATE ... COMMIT, rolling back if the block raises."""
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')